@@ -17,13 +17,16 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .coordinator import SolemCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +42,11 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Per controller alias of set_irrigation_schedule, still called by the Solem Schedule Card
+LEGACY_SET_SCHEDULE_SERVICE = "set_irrigation_schedule"
+
 type MyConfigEntry = ConfigEntry[RuntimeData]
 
 
@@ -50,6 +58,12 @@ class RuntimeData:
     cancel_update_listener: Callable
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the domain services, shared by every controller."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -> bool:
     """Set up Solem Integration from a config entry."""
 
@@ -93,8 +107,12 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
     # ----------------------------------------------------------------------------
     config_entry.runtime_data = RuntimeData(coordinator, cancel_update_listener)
 
+    # Cancel the coordinator's listeners (e.g. rain sensor) when the entry is unloaded
+    config_entry.async_on_unload(coordinator.async_shutdown)
+
     # ----------------------------------------------------------------------------
-    # Registers the new service to update schedule
+    # Registers the per controller alias of the schedule service (the domain
+    # services are registered once in async_setup)
     # ----------------------------------------------------------------------------
     async def handle_set_schedule(call: ServiceCall):
         """Updates irrigation schedule from frontend."""
@@ -102,10 +120,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
         
         await coordinator.async_set_schedule(new_schedule)
 
-    service_name = f"set_irrigation_schedule_{coordinator.controller_mac_address.lower().replace(":", "_")}"
+    service_name = _service_name(LEGACY_SET_SCHEDULE_SERVICE, coordinator)
 
     if not hass.services.has_service(DOMAIN, service_name):
-        _LOGGER.info(f"{coordinator.controller_mac_address} - Registering set_irrigation_schedule_{coordinator.controller_mac_address.lower().replace(":", "_")} service...")
+        _LOGGER.info(f"{coordinator.controller_mac_address} - Registering {service_name} service...")
         hass.services.async_register(DOMAIN, service_name, handle_set_schedule)
         _LOGGER.info(f"{coordinator.controller_mac_address} - Registered.")
 
@@ -120,6 +138,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: MyConfigEntry) ->
     return True
 
 
+def _service_name(service: str, coordinator: SolemCoordinator) -> str:
+    """Service name for one controller, e.g. set_irrigation_schedule_aa_bb_cc_dd_ee_ff."""
+    return f"{service}_{coordinator.controller_mac_address.lower().replace(':', '_')}"
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle config options update.
 
@@ -166,8 +189,8 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -
     #for service in hass.services.async_services_for_domain(DOMAIN):
         #hass.services.async_remove(DOMAIN, service)
 
-    service_name = f"set_irrigation_schedule_{runtime_data.coordinator.controller_mac_address.lower().replace(":", "_")}"
-    hass.services.async_remove(DOMAIN, service_name)
+    hass.services.async_remove(DOMAIN, _service_name(LEGACY_SET_SCHEDULE_SERVICE, runtime_data.coordinator))
+    hass.data[DOMAIN].pop(config_entry.entry_id, None)
 
     # Unload platforms and return result
     return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
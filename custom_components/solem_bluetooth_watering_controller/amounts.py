@@ -0,0 +1,107 @@
+"""Watering amounts derived from the irrigation inputs.
+
+The inputs feed a small dependency graph, per station except for the rain:
+
+    minutes today, flow rate, area -> target -> forecasted -> remaining -> needs watering
+                          rain forecast ----------^              ^
+                          applied today -------------------------'
+
+Setting the inputs only marks stale the nodes depending on values that actually
+changed, and recompute() evaluates just those, returning the stations whose
+amounts moved.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def mm_per_minute(flow_rate: float, area: float) -> float:
+    """Water depth (mm) applied per minute by a flow rate (L/min) on an area (m²)."""
+    return flow_rate / (area or 1)  # avoid division by zero
+
+
+class WateringAmounts:
+    """Per-station amounts of water (mm) planned and still to apply today."""
+
+    def __init__(self, num_stations: int) -> None:
+        """Initialise."""
+        self.num_stations = num_stations
+        self._minutes = [0] * num_stations
+        self._flow_rates = [0.0] * num_stations
+        self._areas = [0.0] * num_stations
+        self._applied = [0.0] * num_stations
+        self._rain_mm = 0.0
+
+        # Target applied by the schedule
+        self.targets = [0.0] * num_stations
+        # Target minus the rain expected today
+        self.forecasted = [0.0] * num_stations
+        # Forecasted minus what was already applied
+        self.remaining = [0.0] * num_stations
+        self.needs_watering = False
+
+        self._stale_targets: set[int] = set()
+        self._stale_forecasted: set[int] = set()
+        self._stale_remaining: set[int] = set()
+
+    def _set(self, values: list, new_values: Sequence, stale: set[int]) -> None:
+        for index, value in enumerate(new_values[: self.num_stations]):
+            if values[index] != value:
+                values[index] = value
+                stale.add(index)
+
+    def set_inputs(
+        self,
+        *,
+        minutes: Sequence[int] | None = None,
+        flow_rates: Sequence[float] | None = None,
+        areas: Sequence[float] | None = None,
+        applied: Sequence[float] | None = None,
+        rain_mm: float | None = None,
+    ) -> None:
+        """Update inputs, marking stale what depends on the changed ones."""
+        if minutes is not None:
+            self._set(self._minutes, minutes, self._stale_targets)
+        if flow_rates is not None:
+            self._set(self._flow_rates, flow_rates, self._stale_targets)
+        if areas is not None:
+            self._set(self._areas, areas, self._stale_targets)
+        if applied is not None:
+            self._set(self._applied, applied, self._stale_remaining)
+        if rain_mm is not None and rain_mm != self._rain_mm:
+            self._rain_mm = rain_mm
+            self._stale_forecasted.update(range(self.num_stations))
+
+    def recompute(self) -> set[int]:
+        """Evaluate the stale nodes; returns the (0 based) stations whose amounts changed."""
+        changed: set[int] = set()
+
+        for index in self._stale_targets:
+            target = round(mm_per_minute(self._flow_rates[index], self._areas[index]) * self._minutes[index], 2)
+            if target != self.targets[index]:
+                self.targets[index] = target
+                self._stale_forecasted.add(index)
+                changed.add(index)
+
+        for index in self._stale_forecasted:
+            forecasted = max(0.0, self.targets[index] - self._rain_mm)
+            if forecasted != self.forecasted[index]:
+                self.forecasted[index] = forecasted
+                self._stale_remaining.add(index)
+                changed.add(index)
+
+        remaining_changed = False
+        for index in self._stale_remaining:
+            remaining = max(0.0, self.forecasted[index] - self._applied[index])
+            if remaining != self.remaining[index]:
+                self.remaining[index] = remaining
+                remaining_changed = True
+                changed.add(index)
+        if remaining_changed:
+            self.needs_watering = any(remaining > 0 for remaining in self.remaining)
+
+        self._stale_targets.clear()
+        self._stale_forecasted.clear()
+        self._stale_remaining.clear()
+        return changed
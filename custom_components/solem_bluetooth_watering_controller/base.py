@@ -53,6 +53,13 @@ class SolemBaseEntity(CoordinatorEntity):
         self.device_id = device["device_id"]
         self.parameter = parameter
 
+    async def async_added_to_hass(self) -> None:
+        """Also listen for updates pushed to this device only."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(self.device_id, self._handle_coordinator_update)
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
@@ -61,6 +61,21 @@ async def async_setup_entry(
     async_add_entities(binary_sensors)
 
 
+def _weather_status_attributes(coordinator: SolemCoordinator, kind: str) -> dict:
+    """Staleness metadata of the weather data backing a sensor."""
+    status = coordinator.weather_status.get(kind)
+    if not status:
+        return {}
+    attrs = {
+        "fetched_at": status["fetched_at"],
+        "stale": status["stale"],
+        "consecutive_failures": status["consecutive_failures"],
+    }
+    if "providers" in coordinator.weather_status:
+        attrs["providers"] = coordinator.weather_status["providers"]
+    return attrs
+
+
 class BooleanBinarySensor(SolemBaseEntity, BinarySensorEntity):
     """Implementation of a sensor.
 
@@ -71,6 +86,8 @@ class BooleanBinarySensor(SolemBaseEntity, BinarySensorEntity):
     """
 
 class WillRainToday(BooleanBinarySensor):
+    # Large attributes stay out of the recorder, the small summaries are recorded
+    _unrecorded_attributes = frozenset({"forecast", "providers"})
 
     @property
     def is_on(self) -> bool | None:
@@ -83,7 +100,11 @@ class WillRainToday(BooleanBinarySensor):
         """Return the extra state attributes."""
         # Add any additional attributes you want on your sensor.
         attrs = {}
-        attrs["forecast"] = self.coordinator.will_it_rain_today_forecast
+        forecast = self.coordinator.will_it_rain_today_forecast or []
+        attrs["forecast"] = forecast
+        attrs["max_pop"] = max((block.get("pop", 0) for block in forecast), default=0)
+        attrs["rain_forecast"] = self.coordinator.rain_total_amount_forecasted_today
+        attrs.update(_weather_status_attributes(self.coordinator, "forecast"))
         return attrs
 
 class HasRainedToday(BooleanBinarySensor):
@@ -95,6 +116,8 @@ class HasRainedToday(BooleanBinarySensor):
         return self.coordinator.has_rained_today
 
 class IsRainingNow(BooleanBinarySensor):
+    # Large attributes stay out of the recorder, the small summaries are recorded
+    _unrecorded_attributes = frozenset({"current", "providers"})
 
     @property
     def is_on(self) -> bool | None:
@@ -107,5 +130,8 @@ class IsRainingNow(BooleanBinarySensor):
         """Return the extra state attributes."""
         # Add any additional attributes you want on your sensor.
         attrs = {}
-        attrs["current"] = self.coordinator.is_raining_now_json
+        current = self.coordinator.is_raining_now_json or {}
+        attrs["current"] = current
+        attrs["rain_rate"] = (current.get("rain") or {}).get("1h", 0)
+        attrs.update(_weather_status_attributes(self.coordinator, "current"))
         return attrs
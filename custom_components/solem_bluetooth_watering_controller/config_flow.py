@@ -37,10 +37,13 @@ from .const import (
     CONTROLLER_MAC_ADDRESS,
     NUM_STATIONS,
     OPEN_WEATHER_MAP_API_KEY,
+    WEATHER_ENTITY,
+    RAIN_SENSOR,
     SPRINKLE_WITH_RAIN,
     MAX_SPRINKLES_PER_DAY,
     SOIL_MOISTURE_SENSOR,
     SOIL_MOISTURE_THRESHOLD,
+    STATION_SOIL_MOISTURE_SENSORS,
     DEFAULT_SOIL_MOISTURE,
     MONTHS,
     BLUETOOTH_TIMEOUT,
@@ -49,6 +52,19 @@ from .const import (
     OPEN_WEATHER_MAP_API_CACHE_TIMEOUT,
     OPEN_WEATHER_MAP_API_CACHE_MIN_TIMEOUT,
     OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT,
+    OPEN_WEATHER_MAP_DAILY_BUDGET,
+    OPEN_WEATHER_MAP_DAILY_MIN_BUDGET,
+    OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET,
+    EVENT_DRIVEN_UPDATES,
+    SITE_MAX_FLOW,
+    SITE_MAX_VALVES,
+    WEATHER_DEBUG_PAYLOADS,
+    WEATHER_HEDGE_DELAY,
+    WEATHER_HEDGE_MIN_DELAY,
+    WATERING_CALENDAR_DAYS,
+    WATERING_CALENDAR_MIN_DAYS,
+    WATERING_CALENDAR_DEFAULT_DAYS,
+    WEATHER_HEDGE_DEFAULT_DELAY,
     SOLEM_API_MOCK
 )
 
@@ -178,6 +194,9 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                     {"entity": {"domain": "zone"}}
                 ),
                 vol.Optional(OPEN_WEATHER_MAP_API_KEY, default=""): str,
+                vol.Optional(WEATHER_ENTITY): selector(
+                    {"entity": {"domain": "weather"}}
+                ),
                 vol.Required(SPRINKLE_WITH_RAIN): selector(
                     {
                         "select": {
@@ -190,6 +209,9 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Optional(SOIL_MOISTURE_SENSOR): selector(
                     {"entity": {"domain": "sensor", "device_class": "humidity"}}
                 ),
+                vol.Optional(RAIN_SENSOR): selector(
+                    {"entity": {"domain": ["binary_sensor", "sensor"]}}
+                ),
                 vol.Optional(SOIL_MOISTURE_THRESHOLD, default=DEFAULT_SOIL_MOISTURE): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
             }
         )
@@ -216,6 +238,7 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                     for i in range(1, self.num_stations + 1)
                 ]
                 self._input_data["station_areas"] = station_areas
+                self._input_data[STATION_SOIL_MOISTURE_SENSORS] = self._station_soil_moisture_sensors(user_input)
     
                 return self.async_create_entry(
                     title=self._input_data[CONTROLLER_MAC_ADDRESS],
@@ -311,6 +334,9 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                         {"entity": {"domain": "zone"}}
                     ),
                     vol.Optional(OPEN_WEATHER_MAP_API_KEY, default=config_entry.data.get(OPEN_WEATHER_MAP_API_KEY, "")): str,
+                    vol.Optional(WEATHER_ENTITY, description={"suggested_value": config_entry.data.get(WEATHER_ENTITY)}): selector(
+                        {"entity": {"domain": "weather"}}
+                    ),
                     vol.Required(SPRINKLE_WITH_RAIN, default=config_entry.data[SPRINKLE_WITH_RAIN]): selector(
                         {
                             "select": {
@@ -323,6 +349,9 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Optional(SOIL_MOISTURE_SENSOR, default=config_entry.data[SOIL_MOISTURE_SENSOR]): selector(
                         {"entity": {"domain": "sensor", "device_class": "humidity"}}
                     ),
+                    vol.Optional(RAIN_SENSOR, description={"suggested_value": config_entry.data.get(RAIN_SENSOR)}): selector(
+                        {"entity": {"domain": ["binary_sensor", "sensor"]}}
+                    ),
                     vol.Optional(SOIL_MOISTURE_THRESHOLD, default=config_entry.data.get(SOIL_MOISTURE_THRESHOLD, DEFAULT_SOIL_MOISTURE)): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
                 }
             ),
@@ -346,6 +375,7 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                     for i in range(1, self.num_stations + 1)
                 ]
                 self._input_data["station_areas"] = station_areas
+                self._input_data[STATION_SOIL_MOISTURE_SENSORS] = self._station_soil_moisture_sensors(user_input)
     
                 return self.async_update_reload_and_abort(
                     config_entry,
@@ -357,7 +387,9 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Failed to process reconfigured station areas")
                 errors["base"] = "unknown"
     
-        area_schema = self._build_station_area_schema(previous_areas)
+        area_schema = self._build_station_area_schema(
+            previous_areas, config_entry.data.get(STATION_SOIL_MOISTURE_SENSORS)
+        )
     
         return self.async_show_form(
             step_id="station_areas_reconfigure",
@@ -366,16 +398,31 @@ class SolemConfigFlow(ConfigFlow, domain=DOMAIN):
             last_step=True,
         )
         
-    def _build_station_area_schema(self, defaults: list[float] | None = None) -> vol.Schema:
-        """Generate schema for station areas with optional defaults."""
-        return vol.Schema({
-            vol.Required(
+    def _build_station_area_schema(
+        self, defaults: list[float] | None = None, soil_sensors: list[str | None] | None = None
+    ) -> vol.Schema:
+        """Generate schema for station areas (and soil moisture sensors) with optional defaults."""
+        schema = {}
+        for i in range(1, self.num_stations + 1):
+            schema[vol.Required(
                 f"station_{i}_area",
                 default=defaults[i - 1] if defaults and i - 1 < len(defaults) else 0,
                 description={"translation_key": f"station_{i}_area"},
-            ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            )] = vol.All(vol.Coerce(float), vol.Range(min=0))
+            schema[vol.Optional(
+                f"station_{i}_soil_moisture_sensor",
+                description={
+                    "suggested_value": soil_sensors[i - 1] if soil_sensors and i - 1 < len(soil_sensors) else None
+                },
+            )] = selector({"entity": {"domain": "sensor", "device_class": "humidity"}})
+        return vol.Schema(schema)
+
+    def _station_soil_moisture_sensors(self, user_input: dict[str, Any]) -> list[str | None]:
+        """Soil moisture sensor of each station, None to use the controller one."""
+        return [
+            user_input.get(f"station_{i}_soil_moisture_sensor") or None
             for i in range(1, self.num_stations + 1)
-        })
+        ]
 
 class SolemOptionsFlowHandler(OptionsFlow):
     """Handles the options flow."""
@@ -408,6 +455,44 @@ class SolemOptionsFlowHandler(OptionsFlow):
                     OPEN_WEATHER_MAP_API_CACHE_TIMEOUT,
                     default=self.options.get(OPEN_WEATHER_MAP_API_CACHE_TIMEOUT, OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT),
                 ): (vol.All(vol.Coerce(int), vol.Clamp(min=OPEN_WEATHER_MAP_API_CACHE_MIN_TIMEOUT))),
+                vol.Required(
+                    OPEN_WEATHER_MAP_DAILY_BUDGET,
+                    default=self.options.get(OPEN_WEATHER_MAP_DAILY_BUDGET, OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET),
+                ): (vol.All(vol.Coerce(int), vol.Clamp(min=OPEN_WEATHER_MAP_DAILY_MIN_BUDGET))),
+                vol.Required(
+                    WEATHER_HEDGE_DELAY,
+                    default=self.options.get(WEATHER_HEDGE_DELAY, WEATHER_HEDGE_DEFAULT_DELAY),
+                ): (vol.All(vol.Coerce(float), vol.Clamp(min=WEATHER_HEDGE_MIN_DELAY))),
+                vol.Required(
+                    WATERING_CALENDAR_DAYS,
+                    default=self.options.get(WATERING_CALENDAR_DAYS, WATERING_CALENDAR_DEFAULT_DAYS),
+                ): (vol.All(vol.Coerce(int), vol.Clamp(min=WATERING_CALENDAR_MIN_DAYS))),
+                vol.Required(WEATHER_DEBUG_PAYLOADS, default=self.options.get(WEATHER_DEBUG_PAYLOADS, "false")): selector(
+                    {
+                        "select": {
+                            "options": ["false", "true"],
+                            "mode": "dropdown",
+                            "translation_key": "true_false_selector",
+                        }
+                    }
+                ),
+                vol.Required(
+                    SITE_MAX_FLOW,
+                    default=self.options.get(SITE_MAX_FLOW, 0),
+                ): (vol.All(vol.Coerce(float), vol.Clamp(min=0))),
+                vol.Required(
+                    SITE_MAX_VALVES,
+                    default=self.options.get(SITE_MAX_VALVES, 0),
+                ): (vol.All(vol.Coerce(int), vol.Clamp(min=0))),
+                vol.Required(EVENT_DRIVEN_UPDATES, default=self.options.get(EVENT_DRIVEN_UPDATES, "false")): selector(
+                    {
+                        "select": {
+                            "options": ["false", "true"],
+                            "mode": "dropdown",
+                            "translation_key": "true_false_selector",
+                        }
+                    }
+                ),
                 vol.Required(SOLEM_API_MOCK, default=self.options.get(SOLEM_API_MOCK, "false")): selector(
                     {
                         "select": {
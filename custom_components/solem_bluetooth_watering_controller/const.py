@@ -4,13 +4,46 @@ DOMAIN = "solem_bluetooth_watering_controller"
 
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 10
+
+# Adaptive polling: the scan interval applies while sprinkling or raining, longer
+# intervals (never shorter than the scan interval) otherwise
+POLL_POLICY_ACTIVE = "active"
+POLL_POLICY_PRE_CYCLE = "pre_cycle"
+POLL_POLICY_IDLE = "idle"
+POLL_POLICY_DORMANT = "dormant"
+POLL_POLICY_EVENT_DRIVEN = "event_driven"
+POLL_PRE_CYCLE_LEAD_MINUTES = 60
+POLL_PRE_CYCLE_INTERVAL = 5 * 60
+POLL_IDLE_INTERVAL = 15 * 60
+POLL_DORMANT_INTERVAL = 60 * 60
+# Optional mode without periodic updates: state is pushed on events
+EVENT_DRIVEN_UPDATES = "event_driven_updates"
+# Site limits of the supply line shared by the controllers, 0 means unlimited
+SITE_MAX_FLOW = "site_max_flow"
+SITE_MAX_VALVES = "site_max_valves"
+# Key of the site scheduler shared by the controllers in hass.data[DOMAIN]
+SITE_SCHEDULER = "site_scheduler"
+# Times a waiting run may be overtaken by later ones before it goes first
+SITE_LEASE_MAX_BYPASS = 3
+# Watering hours added to a proposed schedule when the month has fewer
+PROPOSED_SCHEDULE_HOURS = ["07:00", "21:00", "14:00"]
 CONTROLLER_MAC_ADDRESS = "controller_mac_address"
 NUM_STATIONS = "num_stations"
 SPRINKLE_WITH_RAIN = "sprinkle_with_rain"
 OPEN_WEATHER_MAP_API_KEY = "open_weather_map_api_key"
+WEATHER_ENTITY = "weather_entity"
+RAIN_SENSOR = "rain_sensor"
+# A rain gauge without increments for this long is considered dry
+RAIN_GAUGE_DRY_MINUTES = 15
+# Depth units of rain sensors (gauges, or rates per hour/day), in mm; no unit is taken as mm
+RAIN_SENSOR_UNITS_MM = {"": 1.0, "mm": 1.0, "cm": 10.0, "in": 25.4}
+# A rain rate observation (OWM rain.1h) covers one hour, it is not extrapolated further
+RAIN_OBSERVATION_MAX_AGE_SECONDS = 60 * 60
 SOIL_MOISTURE_SENSOR = "soil_moisture_sensor"
 SOIL_MOISTURE_THRESHOLD = "soil_moisture_threshold"
 DEFAULT_SOIL_MOISTURE = 40
+# Per station soil moisture sensors, the controller one applies to stations without
+STATION_SOIL_MOISTURE_SENSORS = "station_soil_moisture_sensors"
 MAX_SPRINKLES_PER_DAY = 5
 MONTHS = [
     "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"
@@ -22,8 +55,23 @@ BLUETOOTH_MIN_TIMEOUT = 5
 BLUETOOTH_DEFAULT_TIMEOUT = 15
 
 OPEN_WEATHER_MAP_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast?units=metric&"
-OPEN_WEATHER_MAP_CURRENT_URL = "https://api.openweathermap.org/data/2.5/weather?"
+OPEN_WEATHER_MAP_CURRENT_URL = "https://api.openweathermap.org/data/2.5/weather?units=metric&"
 OPEN_WEATHER_MAP_API_CACHE_TIMEOUT = "openweathermap_api_cache_timeout"
 OPEN_WEATHER_MAP_API_CACHE_MIN_TIMEOUT = 1
 OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT = 5
+OPEN_WEATHER_MAP_DAILY_BUDGET = "openweathermap_daily_budget"
+OPEN_WEATHER_MAP_DAILY_MIN_BUDGET = 10
+OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET = 1000
+WEATHER_DECISION_LEAD_MINUTES = 15
+WEATHER_IDLE_REFRESH_MINUTES = 60
+WATERING_CALENDAR_DAYS = "watering_calendar_days"
+WATERING_CALENDAR_MIN_DAYS = 1
+WATERING_CALENDAR_DEFAULT_DAYS = 14
+WEATHER_DEBUG_PAYLOADS = "weather_debug_payloads"
+WEATHER_HEDGE_DELAY = "weather_hedge_delay"
+WEATHER_HEDGE_MIN_DELAY = 0.1
+WEATHER_HEDGE_DEFAULT_DELAY = 2
+WEATHER_REQUEST_TIMEOUT_SECONDS = 10
+WEATHER_BACKOFF_BASE_SECONDS = 60
+WEATHER_BACKOFF_MAX_SECONDS = 3600
 SOLEM_API_MOCK = "solem_api_mock"
\ No newline at end of file
@@ -1,12 +1,13 @@
 """DataUpdateCoordinator for our integration."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from homeassistant.util import dt as dt_util
 import logging
 import asyncio
+import time
 from asyncio import sleep
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.storage import Store
 
 from homeassistant.config_entries import ConfigEntry
@@ -14,31 +15,89 @@ from homeassistant.const import (
     CONF_SENSORS,
     CONF_SCAN_INTERVAL,
 )
-from homeassistant.core import DOMAIN, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, DOMAIN, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.event import async_call_later
 
-from .util import mac_to_uuid, ensure_datetime, ensure_aware
+from .util import mac_to_uuid, ensure_datetime, ensure_aware, ElapsedTimer, RateIntegrator
+from .amounts import WateringAmounts, mm_per_minute
 from .models import IrrigationController, IrrigationStation
-from .api import SolemAPI, OpenWeatherMapAPI, APIConnectionError
+from .api import SolemAPI, APIConnectionError
+from .forecast import FORECAST_DAYS, CurrentWeather
+from .schedule import CompiledSchedule, MonthSchedule, ScheduleError, WateringCalendar
+from .scheduler import DayPlan, WateringScheduler
+from .site_scheduler import get_site_scheduler
+from .weather_provider import (
+    HedgedWeatherProvider,
+    HomeAssistantWeatherProvider,
+    OpenWeatherMapAPI,
+    WeatherProvider,
+)
 from .const import (
     DEFAULT_SCAN_INTERVAL,
+    POLL_POLICY_ACTIVE,
+    POLL_POLICY_DORMANT,
+    POLL_POLICY_EVENT_DRIVEN,
+    EVENT_DRIVEN_UPDATES,
+    STATION_SOIL_MOISTURE_SENSORS,
+    SITE_MAX_FLOW,
+    SITE_MAX_VALVES,
+    PROPOSED_SCHEDULE_HOURS,
+    POLL_POLICY_IDLE,
+    POLL_POLICY_PRE_CYCLE,
+    POLL_DORMANT_INTERVAL,
+    POLL_IDLE_INTERVAL,
+    POLL_PRE_CYCLE_INTERVAL,
+    POLL_PRE_CYCLE_LEAD_MINUTES,
     CONTROLLER_MAC_ADDRESS,
     NUM_STATIONS,
     OPEN_WEATHER_MAP_API_KEY,
+    WEATHER_ENTITY,
+    RAIN_SENSOR,
+    RAIN_GAUGE_DRY_MINUTES,
+    RAIN_OBSERVATION_MAX_AGE_SECONDS,
+    RAIN_SENSOR_UNITS_MM,
     SPRINKLE_WITH_RAIN,
     BLUETOOTH_TIMEOUT,
     BLUETOOTH_MIN_TIMEOUT,
     BLUETOOTH_DEFAULT_TIMEOUT,
     OPEN_WEATHER_MAP_API_CACHE_TIMEOUT,
     OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT,
+    OPEN_WEATHER_MAP_DAILY_BUDGET,
+    OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET,
+    WEATHER_DEBUG_PAYLOADS,
+    WEATHER_HEDGE_DELAY,
+    WEATHER_HEDGE_DEFAULT_DELAY,
+    WATERING_CALENDAR_DAYS,
+    WATERING_CALENDAR_DEFAULT_DAYS,
     SOLEM_API_MOCK
 )
 
+if TYPE_CHECKING:
+    from .simulator import ScheduleProposal
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _propose_schedule_job(
+    daily_rain: list[float] | None,
+    synthetic: tuple[int, float, float, int | None],
+    station_mm_per_minute: list[float],
+    weekly_mm: list[float],
+) -> tuple[list[float], "ScheduleProposal"]:
+    """Simulate the season and search the schedule, in the executor.
+
+    NumPy is only imported here, so the integration loads without it.
+    """
+    from .simulator import optimize_schedule, synthetic_rain
+
+    if daily_rain is None:
+        daily_rain = synthetic_rain(*synthetic).tolist()
+    return daily_rain, optimize_schedule(daily_rain, station_mm_per_minute, weekly_mm)
+
+
 class SolemCoordinator(DataUpdateCoordinator):
     """Solem coordinator."""
 
@@ -54,6 +113,7 @@ class SolemCoordinator(DataUpdateCoordinator):
         
         self.sprinkle_with_rain = config_entry.data[SPRINKLE_WITH_RAIN] == "true"
         self.openweathermap_api_key = config_entry.data.get(OPEN_WEATHER_MAP_API_KEY)
+        self.weather_entity = config_entry.data.get(WEATHER_ENTITY)
         zone_entity_id = config_entry.data[CONF_SENSORS]
         zone_state = hass.states.get(zone_entity_id)
 
@@ -62,6 +122,7 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.longitude = zone_state.attributes.get("longitude")
 
         self.soil_moisture_sensor = config_entry.data.get("soil_moisture_sensor")
+        self.rain_sensor = config_entry.data.get(RAIN_SENSOR)
         self.soil_moisture_threshold = float(config_entry.data.get("soil_moisture_threshold", 0))
 
         # set variables from options.  You need a default here in case options have not been set
@@ -74,7 +135,24 @@ class SolemCoordinator(DataUpdateCoordinator):
         self.openweathermap_api_timeout = config_entry.options.get(
             OPEN_WEATHER_MAP_API_CACHE_TIMEOUT, OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT
         )
+        self.openweathermap_daily_budget = config_entry.options.get(
+            OPEN_WEATHER_MAP_DAILY_BUDGET, OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET
+        )
+        self.weather_hedge_delay = config_entry.options.get(
+            WEATHER_HEDGE_DELAY, WEATHER_HEDGE_DEFAULT_DELAY
+        )
+        self.weather_debug_payloads = config_entry.options.get(WEATHER_DEBUG_PAYLOADS, "false") == "true"
+        self.watering_calendar_days = config_entry.options.get(
+            WATERING_CALENDAR_DAYS, WATERING_CALENDAR_DEFAULT_DAYS
+        )
         self.solem_api_mock = config_entry.options.get(SOLEM_API_MOCK, "false") == "true"
+        self.event_driven = config_entry.options.get(EVENT_DRIVEN_UPDATES, "false") == "true"
+        self.site_scheduler = get_site_scheduler(hass)
+        self.site_scheduler.register(
+            config_entry.entry_id,
+            config_entry.options.get(SITE_MAX_FLOW, 0),
+            config_entry.options.get(SITE_MAX_VALVES, 0),
+        )
 
         # Initialise DataUpdateCoordinator
         super().__init__(
@@ -119,23 +197,69 @@ class SolemCoordinator(DataUpdateCoordinator):
         ]
         
         self.api = SolemAPI(mac_address=self.controller_mac_address, bluetooth_timeout=self.bluetooth_timeout)
-        if self.openweathermap_api_key:
-            self.weather_api = OpenWeatherMapAPI(
-                self.openweathermap_api_key,
-                self.latitude,
-                self.longitude,
-                self.openweathermap_api_timeout,
-            )
-        else:
-            self.weather_api = None
+        self.weather_api = self.create_weather_api()
         self.storage = Store(hass, 1, f"irrigation_{config_entry.unique_id}")
         self.irrigation_stop_event = asyncio.Event()
+        self.storage_loaded = asyncio.Event()
+        self._unsub_rain_sensor = None
+        self._rain_stop_task = None
+        self._unsub_soil_moisture = None
+        self._soil_moisture: dict[str, float | None] = {}
+        self._soil_gated_station: int | None = None
+        self._soil_stop_task = None
+        self.station_soil_moisture_sensors: list[str | None] = []
+        self._rain_time_mark = None
+        self._sensor_rain_rate = RateIntegrator()
+        self._weather_rain_rate = RateIntegrator(max_age=RAIN_OBSERVATION_MAX_AGE_SECONDS)
+        self._rain_gauge_value = None
+        self._rain_gauge_last_increment = None
+        self.weather_status = {}
+        self.compiled_schedule: CompiledSchedule | None = None
+        self.watering_calendar: WateringCalendar | None = None
+        self.next_schedule: datetime | None = None
+        self.scheduler = WateringScheduler(hass, self)
+        self.poll_policy = None
+        self._unsub_weather_refresh = None
+        self._weather_refresh_at: datetime | None = None
+        self.sprinkle_minutes_today = [0] * self.num_stations
+        self.watering_amounts = WateringAmounts(self.num_stations)
+        self._device_listeners: dict[str, list[CALLBACK_TYPE]] = {}
         
         self.init_task = hass.async_create_task(self.async_init())
     
         _LOGGER.info(f"{self.controller_mac_address} - Coordinator initialization finished!")
 
 
+    def create_weather_api(self) -> WeatherProvider | None:
+        """Create the configured weather provider.
+
+        A HA weather entity is the primary provider; with an OpenWeatherMap key as
+        well, requests are hedged to OpenWeatherMap when the entity is slow or failing.
+        """
+        providers: list[WeatherProvider] = []
+        if self.weather_entity:
+            providers.append(
+                HomeAssistantWeatherProvider(self.hass, self.weather_entity, self.openweathermap_api_timeout)
+            )
+        if self.openweathermap_api_key:
+            providers.append(
+                OpenWeatherMapAPI(
+                    self.hass,
+                    self.config_entry.entry_id,
+                    self.openweathermap_api_key,
+                    self.latitude,
+                    self.longitude,
+                    self.openweathermap_api_timeout,
+                    self.openweathermap_daily_budget,
+                    keep_raw=self.weather_debug_payloads,
+                )
+            )
+        if not providers:
+            return None
+        if len(providers) == 1:
+            return providers[0]
+        return HedgedWeatherProvider(self.hass, providers, self.weather_hedge_delay)
+
     async def update_config(self, new_config: ConfigEntry):
         """Update the coordinator with new configuration."""
         
@@ -145,6 +269,7 @@ class SolemCoordinator(DataUpdateCoordinator):
         self.controller_mac_address = self.config_entry.data[CONTROLLER_MAC_ADDRESS].rsplit(' - ', 1)[1]
         self.sprinkle_with_rain = self.config_entry.data.get(SPRINKLE_WITH_RAIN, "False") == "true"
         self.openweathermap_api_key = self.config_entry.data.get(OPEN_WEATHER_MAP_API_KEY)
+        self.weather_entity = self.config_entry.data.get(WEATHER_ENTITY)
         zone_entity_id = self.config_entry.data[CONF_SENSORS]
         zone_state = self.hass.states.get(zone_entity_id)
         
@@ -153,6 +278,7 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.longitude = zone_state.attributes.get("longitude")
 
         self.soil_moisture_sensor = config_entry.data.get("soil_moisture_sensor")
+        self.rain_sensor = self.config_entry.data.get(RAIN_SENSOR)
         self.soil_moisture_threshold = float(config_entry.data.get("soil_moisture_threshold", 0))
 
         # set variables from options.  You need a default here in case options have not been set
@@ -165,18 +291,29 @@ class SolemCoordinator(DataUpdateCoordinator):
         self.openweathermap_api_timeout = config_entry.options.get(
             OPEN_WEATHER_MAP_API_CACHE_TIMEOUT, OPEN_WEATHER_MAP_API_CACHE_DEFAULT_TIMEOUT
         )
+        self.openweathermap_daily_budget = self.config_entry.options.get(
+            OPEN_WEATHER_MAP_DAILY_BUDGET, OPEN_WEATHER_MAP_DAILY_DEFAULT_BUDGET
+        )
+        self.weather_hedge_delay = self.config_entry.options.get(
+            WEATHER_HEDGE_DELAY, WEATHER_HEDGE_DEFAULT_DELAY
+        )
+        self.weather_debug_payloads = self.config_entry.options.get(WEATHER_DEBUG_PAYLOADS, "false") == "true"
+        self.watering_calendar_days = self.config_entry.options.get(
+            WATERING_CALENDAR_DAYS, WATERING_CALENDAR_DEFAULT_DAYS
+        )
+        self.watering_calendar = None
         self.solem_api_mock = config_entry.options.get(SOLEM_API_MOCK, "false") == "true"
+        self.event_driven = self.config_entry.options.get(EVENT_DRIVEN_UPDATES, "false") == "true"
+        self.site_scheduler.register(
+            self.config_entry.entry_id,
+            self.config_entry.options.get(SITE_MAX_FLOW, 0),
+            self.config_entry.options.get(SITE_MAX_VALVES, 0),
+        )
 
         self.api = SolemAPI(mac_address=self.controller_mac_address, bluetooth_timeout=self.bluetooth_timeout)
-        if self.openweathermap_api_key:
-            self.weather_api = OpenWeatherMapAPI(
-                self.openweathermap_api_key,
-                self.latitude,
-                self.longitude,
-                self.openweathermap_api_timeout,
-            )
-        else:
-            self.weather_api = None
+        if self.weather_api:
+            self.weather_api.async_cancel()
+        self.weather_api = self.create_weather_api()
 
         self.num_stations = config_entry.data.get("num_stations", 2)
         self.station_areas = config_entry.data.get("station_areas", [0] * self.num_stations)
@@ -195,8 +332,23 @@ class SolemCoordinator(DataUpdateCoordinator):
             )
             for station_id in range(1, self.num_stations + 1)
         ]
+        self.setup_rain_sensor()
+        self.setup_soil_moisture_sensors()
+
+        # Per station values follow the station count: keep the known ones, default the new ones
+        self.water_flow_rate = (self.water_flow_rate + [12] * self.num_stations)[: self.num_stations]
+        self.sprinkle_total_amount_today = (
+            self.sprinkle_total_amount_today + [0.0] * self.num_stations
+        )[: self.num_stations]
+
         # Fazer um refresh imediato com os novos dados
         await self.initialize_schedule()
+        self.sprinkle_minutes_today = await self.calculate_sprinkle_minutes_today(
+            exclude_today=any(self.sprinkle_minutes_today)
+        )
+        # Area edits change today's targets right away
+        self.async_publish_watering_amounts()
+        await self.scheduler.async_rearm()
         await self.async_request_refresh()
         _LOGGER.info(f"{self.controller_mac_address} - Updated Coordinator with new config.")
 
@@ -207,13 +359,17 @@ class SolemCoordinator(DataUpdateCoordinator):
         if storage_data:
             self.will_it_rain_today = storage_data.get("will_it_rain_today")
             self.will_it_rain_today_forecast = storage_data.get("will_it_rain_today_forecast")
-            if self.weather_api:
-                self.weather_api._cache_forecast = self.will_it_rain_today_forecast
             self.has_rained_today = storage_data.get("has_rained_today")
             self.is_raining_now = storage_data.get("is_raining_now")
             self.is_raining_now_json = storage_data.get("is_raining_now_json")
             if self.weather_api:
-                self.weather_api._cache_current = self.is_raining_now_json
+                weather_cache = storage_data.get("weather_cache")
+                if weather_cache is None and isinstance(self.weather_api, OpenWeatherMapAPI):
+                    # Storage written before the weather cache was persisted, fetch times unknown
+                    self.weather_api._cache_forecast.ingest(self.will_it_rain_today_forecast or [])
+                    self.weather_api._cache_current = CurrentWeather.from_dict(self.is_raining_now_json)
+                elif weather_cache and self.weather_api.restore_cache(weather_cache):
+                    _LOGGER.debug(f"{self.controller_mac_address} - Restored weather cache from storage.")
             self.irrigation_manual_duration = storage_data.get("irrigation_manual_duration")
             self.rain_time_today = storage_data.get("rain_time_today", 0)
             self.rain_total_amount_today = storage_data.get("rain_total_amount_today", 0)
@@ -225,23 +381,25 @@ class SolemCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug(f"{self.controller_mac_address} - Initializing sprinkle_total_amount_today with default values.")
                 self.sprinkle_total_amount_today = [0.0] * self.num_stations
 
-            self.sprinkle_target_amount_today = storage_data.get("sprinkle_target_amount_today")
-            if not isinstance(self.sprinkle_target_amount_today, list) or len(self.sprinkle_target_amount_today) != self.num_stations:
-                _LOGGER.debug(f"{self.controller_mac_address} - Initializing sprinkle_target_amount_today with default values.")
-                self.sprinkle_target_amount_today = [0.0] * self.num_stations
-
-            self.forecasted_sprinkle_today = storage_data.get("forecasted_sprinkle_today")
-            if not isinstance(self.forecasted_sprinkle_today, list) or len(self.forecasted_sprinkle_today) != self.num_stations:
-                _LOGGER.debug(f"{self.controller_mac_address} - Initializing forecasted_sprinkle_today with default values.")
-                self.forecasted_sprinkle_today = [0.0] * self.num_stations
-
             self.schedule = storage_data.get("schedule")
+            self.compile_schedule()
 
             self.water_flow_rate = storage_data.get("water_flow_rate")
             if not isinstance(self.water_flow_rate, list) or len(self.water_flow_rate) != self.num_stations:
                 _LOGGER.debug(f"{self.controller_mac_address} - Initializing water_flow_rate with default values.")
                 self.water_flow_rate = [12] * self.num_stations
 
+            self.sprinkle_minutes_today = storage_data.get("sprinkle_minutes_today")
+            if not isinstance(self.sprinkle_minutes_today, list) or len(self.sprinkle_minutes_today) != self.num_stations:
+                # Storage written before the minutes were kept: derive them from today's targets
+                targets = storage_data.get("sprinkle_target_amount_today")
+                if not isinstance(targets, list) or len(targets) != self.num_stations:
+                    targets = [0.0] * self.num_stations
+                self.sprinkle_minutes_today = [
+                    round(target / mm_per_minute(flow, area)) if flow else 0
+                    for target, flow, area in zip(targets, self.water_flow_rate, self.station_areas)
+                ]
+
             last_reset = storage_data.get("last_reset")
             if isinstance(last_reset, str):
                 try:
@@ -283,7 +441,7 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.will_it_rain_today_forecast = []
             self.has_rained_today = False
             self.is_raining_now = False
-            self.is_raining_now_json = []
+            self.is_raining_now_json = {}
             self.last_reset = dt_util.now()
             self.last_sprinkle = dt_util.now()
             self.last_rain = dt_util.now()
@@ -294,10 +452,10 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.irrigation_manual_duration = 10
             self.water_flow_rate = [12] * self.num_stations
             self.sprinkle_total_amount_today = [0.0] * self.num_stations
-            self.sprinkle_target_amount_today = [0.0] * self.num_stations
-            self.forecasted_sprinkle_today = [0.0] * self.num_stations
+            self.sprinkle_minutes_today = [0] * self.num_stations
             
             self.schedule = None
+            self.compiled_schedule = None
 
         _LOGGER.info(f"{self.controller_mac_address} - Persistent data loaded.")
 
@@ -317,7 +475,10 @@ class SolemCoordinator(DataUpdateCoordinator):
             "will_it_rain_today_forecast": self.will_it_rain_today_forecast,
             "has_rained_today": self.has_rained_today,
             "is_raining_now": self.is_raining_now,
-            "is_raining_now_json": self.is_raining_now_json,
+            # The raw provider payload kept for debugging is not persisted
+            "is_raining_now_json": {
+                key: value for key, value in (self.is_raining_now_json or {}).items() if key != "raw"
+            },
             "last_reset": ensure_aware(self.last_reset).strftime("%Y-%m-%d %H:%M:%S"),
             "last_sprinkle": ensure_aware(self.last_sprinkle or datetime.min).strftime("%Y-%m-%d %H:%M:%S"),
             "last_rain": ensure_aware(self.last_rain or datetime.min).strftime("%Y-%m-%d %H:%M:%S"),
@@ -328,32 +489,23 @@ class SolemCoordinator(DataUpdateCoordinator):
             "rain_total_amount_forecasted_today": self.rain_total_amount_forecasted_today,
             "total_water_consumption": self.total_water_consumption,
             "sprinkle_total_amount_today": self.sprinkle_total_amount_today,
+            "sprinkle_minutes_today": self.sprinkle_minutes_today,
             "sprinkle_target_amount_today": self.sprinkle_target_amount_today,
             "forecasted_sprinkle_today": self.forecasted_sprinkle_today,
             "schedule": self.schedule,
+            "weather_cache": self.weather_api.export_cache() if self.weather_api else None,
         }
     
         await self.storage.async_save(storage_data)
         _LOGGER.debug(f"{self.controller_mac_address} - Persistent data saved.")
 
-    async def setup_scheduled_tasks(self):
-        """Create scheduled tasks."""
-        
-        _LOGGER.info(f"{self.controller_mac_address} - Scheduling tasks for midnight...")
-        async_track_time_change(
-            self.hass,
-            lambda *_: self.hass.create_task(self.reset_rain_sprinkle_indicators()),
-            hour=0, minute=0, second=0
-        )
-        async_track_time_change(
-            self.hass,
-            lambda *_: self.hass.create_task(self.check_and_schedule_watering()),
-            hour=0, minute=0, second=0
-        )
-        _LOGGER.info(f"{self.controller_mac_address} - Scheduled tasks.")
-
     async def async_init(self):
-        await self.load_persistent_data()
+        try:
+            await self.load_persistent_data()
+        finally:
+            self.storage_loaded.set()
+        self.setup_rain_sensor()
+        self.setup_soil_moisture_sensors()
         
         """Init APIs and schedule tasks."""
 
@@ -367,51 +519,48 @@ class SolemCoordinator(DataUpdateCoordinator):
 
         await self.initialize_schedule()
 
-        # Executa imediatamente após inicialização
-        await self.check_and_schedule_watering()
-        await self.setup_scheduled_tasks()
+        # Plans today and arms the scheduler (watering times and midnight reset)
+        await self.scheduler.async_rearm()
         self.data = await self.async_update_all_sensors()
 
-    async def calculate_sprinkle_target_amounts(self) -> list[float]:
-        """Calcula os mm que devem ser aplicados hoje por estação, com base na programação."""
-        target = [0.0] * self.num_stations
+    async def calculate_sprinkle_minutes_today(self, exclude_today: bool = False) -> list[int]:
+        """Calcula os minutos de rega de hoje por estação, com base na programação.
+
+        The mm targets follow from them with the flow rates and areas (see amounts.py).
+        With exclude_today, rain and sprinkles of today do not make it a rest day:
+        when recomputing mid-day, today's own sprinkles are part of today's plan.
+        """
+        target = [0] * self.num_stations
         today = dt_util.now().date()
-        current_month_index = today.month - 1
-    
-        month_config = self.schedule[current_month_index]
-        if not month_config:
-            _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle target amounts: {target}")
+
+        if not self.compiled_schedule:
+            _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle minutes today: {target}")
             return target
     
-        watering_hours = [h for h in month_config.get("hours", []) if h]
-        interval_days = month_config.get("interval_days", 2)
-        stations = month_config.get("stations", {})
+        month_schedule = self.compiled_schedule.month(today.month)
+        interval_days = month_schedule.interval_days
     
         # Verifica se é um dia de rega
-        if self.last_rain or self.last_sprinkle:
-            last_event_date = max(filter(None, [self.last_rain, self.last_sprinkle]))
+        events = [event for event in (self.last_rain, self.last_sprinkle) if event]
+        if exclude_today:
+            events = [event for event in events if event.date() < today]
+        if events:
+            last_event_date = max(events)
             days_since_last_event = (today - last_event_date.date()).days
             if days_since_last_event < interval_days:
-                _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle target amounts: {target}")
+                _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle minutes today: {target}")
                 return target  # Não é dia de rega
     
-        if not watering_hours:
-            _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle target amounts: {target}")
+        if not month_schedule.waters:
+            _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle minutes today: {target}")
             return target  # Sem horários = não rega
     
-        occurrences = len(watering_hours)
+        occurrences = len(month_schedule.hours)
     
-        for station_id in range(1, self.num_stations + 1):
-            key = f"station_{station_id}_minutes"
-            minutes = stations.get(key, 0)
-            total_minutes = minutes * occurrences
-            if total_minutes > 0:
-                flow = self.water_flow_rate[station_id - 1]  # L/min
-                area = self.station_areas[station_id - 1] or 1  # m²
-                mm = (flow / area) * total_minutes
-                target[station_id - 1] = round(mm, 2)
+        for station_id, minutes in enumerate(month_schedule.station_minutes, start=1):
+            target[station_id - 1] = minutes * occurrences
     
-        _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle target amounts: {target}")
+        _LOGGER.debug(f"{self.controller_mac_address} - Sprinkle minutes today: {target}")
         return target
 
 
@@ -423,58 +572,108 @@ class SolemCoordinator(DataUpdateCoordinator):
         self.rain_total_amount_today = 0
         self.sprinkle_total_amount_today = [0.0] * self.num_stations
         if self.weather_api:
-            self.rain_total_amount_forecasted_today = await self.weather_api.get_total_rain_forecast_for_today()
+            await self.weather_api.refresh_for_decision()
+            self.rain_total_amount_forecasted_today = await self.get_total_rain_forecast_for_today()
         else:
             self.rain_total_amount_forecasted_today = 0
-        self.sprinkle_target_amount_today = await self.calculate_sprinkle_target_amounts()
-        self.forecasted_sprinkle_today = [
-            max(0.0, target - self.rain_total_amount_forecasted_today)
-            for target in self.sprinkle_target_amount_today
-        ]
+        self.sprinkle_minutes_today = await self.calculate_sprinkle_minutes_today()
         self.last_reset = dt_util.now()
         
         
         _LOGGER.info(f"{self.controller_mac_address} - Resetted rain and sprinkle indicators.")
 
+    @property
+    def sprinkle_target_amount_today(self) -> list[float]:
+        return self.watering_amounts.targets
+
+    @property
+    def forecasted_sprinkle_today(self) -> list[float]:
+        return self.watering_amounts.forecasted
+
+    def update_watering_amounts(self) -> set[int]:
+        """Feed the current inputs to the derived watering amounts.
+
+        Only the amounts depending on changed inputs are recomputed; returns the
+        (0 based) stations whose amounts changed.
+        """
+        if self.watering_amounts.num_stations != self.num_stations:
+            self.watering_amounts = WateringAmounts(self.num_stations)
+        self.watering_amounts.set_inputs(
+            minutes=self.sprinkle_minutes_today,
+            flow_rates=self.water_flow_rate,
+            areas=self.station_areas,
+            applied=self.sprinkle_total_amount_today,
+            rain_mm=self.rain_total_amount_forecasted_today,
+        )
+        return self.watering_amounts.recompute()
+
+    @callback
+    def async_add_device_listener(self, device_id: str, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for updates of a single device, pushed without a coordinator update."""
+        self._device_listeners.setdefault(device_id, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._device_listeners[device_id].remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_publish_watering_amounts(self) -> None:
+        """Recompute the watering amounts and update only the entities of the stations that changed."""
+        for index in sorted(self.update_watering_amounts()):
+            station_id = index + 1
+            device_id = f"{self.controller_mac_address}_forecasted_sprinkle_today_station_{station_id}"
+            if device := self.get_device(device_id):
+                device["state"] = self.calculate_forecasted_sprinkle_today(station_id)
+            for update_callback in list(self._device_listeners.get(device_id, [])):
+                update_callback()
+
+    @callback
+    def async_set_water_flow_rate(self, station_id: int, flow_rate: float) -> None:
+        self.water_flow_rate[station_id - 1] = flow_rate
+        self.async_publish_watering_amounts()
+
     def needs_watering_today(self) -> bool:
         """Check if any station still needs watering today."""
-        for station_id in range(1, self.num_stations + 1):
-            target_mm = self.sprinkle_target_amount_today[station_id - 1]
-            applied_mm = self.sprinkle_total_amount_today[station_id - 1]
-            rain_mm = self.rain_total_amount_forecasted_today
-    
-            remaining = target_mm - (applied_mm + rain_mm)
-            if remaining > 0:
-                _LOGGER.debug(
-                    f"{self.controller_mac_address} - Station {station_id} needs more water: "
-                    f"Target={target_mm}mm, Applied={applied_mm}mm, Rain={rain_mm}mm → Remaining={remaining}mm"
-                )
-                return True  # Pelo menos uma estação ainda precisa de rega
-    
-        _LOGGER.debug(f"{self.controller_mac_address} - All stations have enough water today.")
-        return False
+        self.update_watering_amounts()
+        if not self.watering_amounts.needs_watering:
+            _LOGGER.debug(f"{self.controller_mac_address} - All stations have enough water today.")
+            return False
+
+        # Pelo menos uma estação ainda precisa de rega
+        station_id, remaining = next(
+            (station_id, remaining)
+            for station_id, remaining in enumerate(self.watering_amounts.remaining, start=1)
+            if remaining > 0
+        )
+        _LOGGER.debug(
+            f"{self.controller_mac_address} - Station {station_id} needs more water: "
+            f"Target={self.sprinkle_target_amount_today[station_id - 1]}mm, "
+            f"Applied={self.sprinkle_total_amount_today[station_id - 1]}mm, "
+            f"Rain={self.rain_total_amount_forecasted_today}mm → Remaining={remaining}mm"
+        )
+        return True
 
-    async def check_and_schedule_watering(self, *_):
-        """Check if there should be watering today and schedule the tasks."""
+    async def plan_watering_day(self, refresh_weather: bool = True) -> DayPlan:
+        """Decide whether there should be watering today and at what times."""
         _LOGGER.info(f"{self.controller_mac_address} - Checking and scheduling watering times...")
 
-        if not self.schedule:
+        today = dt_util.now().date()
+
+        if not self.compiled_schedule:
             _LOGGER.warning(f"{self.controller_mac_address} - Schedule not initialized, skipping watering check.")
-            return
+            return DayPlan(today)
 
-        today = dt_util.now().date()
-        current_month_index = today.month - 1
+        if refresh_weather:
+            await self.refresh_weather_for_decision()
 
-        for i in range(12):
-            month_config = self.schedule[(current_month_index + i) % 12]
-            watering_hours = month_config.get("hours", [])
-            if month_config and watering_hours:
-                break
-        else:
-            _LOGGER.info(f"{self.controller_mac_address} - No valid configuration found for any month.")
-            return
+        month_schedule = self.compiled_schedule.month(today.month)
+        if not month_schedule.waters:
+            _LOGGER.info(f"{self.controller_mac_address} - No watering hours configured for this month.")
+            return DayPlan(today)
 
-        interval_days = month_config.get("interval_days", 2)
+        interval_days = month_schedule.interval_days
 
         last_rain = ensure_aware(self.last_rain)
         last_sprinkle = ensure_aware(self.last_sprinkle)
@@ -487,54 +686,42 @@ class SolemCoordinator(DataUpdateCoordinator):
                     f"{self.controller_mac_address} - Last event was {days_since_last_event} days ago. "
                     f"Interval of {interval_days} days not yet passed."
                 )
-                return
+                return DayPlan(today)
 
         if not self.needs_watering_today():
             _LOGGER.info(f"{self.controller_mac_address} - No station needs watering today.")
-            return
+            return DayPlan(today)
 
-        for hour in watering_hours:
-            if hour:
-                try:
-                    watering_time = dt_util.as_local(datetime.combine(today, datetime.strptime(hour, "%H:%M").time()))
-                    delay = (watering_time - dt_util.now()).total_seconds()
-                    if delay > 0:
-                        async_call_later(self.hass, delay, self.run_watering_cycle)
-                        _LOGGER.info(f"{self.controller_mac_address} - Watering scheduled for {watering_time}")
-                except ValueError:
-                    _LOGGER.error(f"{self.controller_mac_address} - Invalid hour format: {hour}")
-
-        _LOGGER.debug(f"{self.controller_mac_address} - Scheduled watering.")
+        plan = DayPlan(
+            today,
+            tuple(dt_util.as_local(datetime.combine(today, hour)) for hour in month_schedule.hours),
+        )
+        _LOGGER.info(f"{self.controller_mac_address} - Watering planned for {[str(when) for when in plan.watering_times]}")
+        return plan
 
 
     async def get_next_watering_date(self) -> datetime:
         """
         Get next watering time considering configurations.
-        """
-        _LOGGER.debug(f"{self.controller_mac_address} - Determining next watering schedule...")
 
-        if not self.schedule:
+        Only the first possible watering day is computed per poll; the watering
+        times come from a calendar rebuilt when that day or the schedule changes.
+        """
+        if not self.compiled_schedule:
             _LOGGER.debug(f"{self.controller_mac_address} - Schedule not initialized yet.")
             return None
         today = dt_util.now().date()
-        current_month_index = today.month - 1
     
         # Procurar um mês com configuração e horários definidos
-        for i in range(12):
-            month_config = self.schedule[(current_month_index + i) % 12]
-            watering_hours = month_config.get("hours", [])
-    
-            if month_config and watering_hours:  # Só considera meses com horários definidos
-                break
-        else:
+        month_schedule = self.compiled_schedule.next_watering_month(today.month)
+        if not month_schedule:
             _LOGGER.debug(f"{self.controller_mac_address} - No configuration with valid hours found for any month.")
             return None
     
-        interval_days = month_config.get("interval_days", 2)
+        interval_days = month_schedule.interval_days
     
         # Se choveu ou vai chover, adia a rega
         if self.has_rained_today or self.will_it_rain_today or self.is_raining_now:
-            _LOGGER.debug(f"{self.controller_mac_address} - No watering today due to rain.")
             next_watering_day = today + timedelta(days=interval_days)
         else:
             next_watering_day = today
@@ -545,73 +732,76 @@ class SolemCoordinator(DataUpdateCoordinator):
             days_since_last_event = (today - last_event_date.date()).days
             if days_since_last_event < interval_days:
                 next_watering_day = last_event_date.date() + timedelta(days=interval_days)
-    
-        # Garantir que estamos num mês com horários configurados
-        while not self.schedule[next_watering_day.month - 1].get("hours", []):
-            next_watering_day += timedelta(days=1)
-    
-        # Determinar a próxima hora válida
-        for hour in watering_hours:
-            try:
-                next_watering_time = datetime.strptime(hour, "%H:%M").time()
-                next_watering_datetime = datetime.combine(next_watering_day, next_watering_time)
-                next_watering_datetime = dt_util.as_local(next_watering_datetime)
-    
-                if next_watering_datetime > dt_util.now():
-                    return next_watering_datetime
-            except ValueError:
-                _LOGGER.error(f"{self.controller_mac_address} - Invalid hour format: {hour}")
-    
-        _LOGGER.debug(f"{self.controller_mac_address} - Determined next watering schedule.")
-    
-        # Se não houver horas válidas, evitar erro de índice e retornar None
-        if not watering_hours:
-            return None
-    
-        fallback_time = datetime.combine(
-            next_watering_day + timedelta(days=1),
-            datetime.strptime(watering_hours[0], "%H:%M").time()
-        )
-        return dt_util.as_local(fallback_time)
+
+        tomorrow = today + timedelta(days=1)
+        calendar = self.watering_calendar
+        if (
+            next_watering_day <= today
+            and calendar is not None
+            and calendar.is_valid_for(self.compiled_schedule, tomorrow)
+        ):
+            # Today's watering times were already found to be over
+            next_watering_day = tomorrow
+
+        now = dt_util.now()
+        next_event = self.get_watering_calendar(next_watering_day).next_event(now)
+        if next_event is None and next_watering_day <= today:
+            # Today's watering times are over and the horizon ended with them: go on from tomorrow
+            next_event = self.get_watering_calendar(tomorrow).next_event(now)
+        return next_event
+
+    def get_watering_calendar(self, first_day: date) -> WateringCalendar:
+        """Return the watering calendar from the given day, rebuilding it only when needed."""
+        calendar = self.watering_calendar
+        if calendar is None or not calendar.is_valid_for(self.compiled_schedule, first_day):
+            calendar = WateringCalendar(self.compiled_schedule, first_day, self.watering_calendar_days)
+            self.watering_calendar = calendar
+            _LOGGER.debug(
+                f"{self.controller_mac_address} - Built watering calendar from {first_day}: {len(calendar)} watering times."
+            )
+        return calendar
 
     async def run_watering_cycle(self, *_):
         """Run the scheduled watering cycle if all conditions are met."""
         _LOGGER.info(f"{self.controller_mac_address} - Running scheduled watering cycle...")
-    
-        # Check soil moisture before proceeding
-        if self.soil_moisture_sensor:
-            state = self.hass.states.get(self.soil_moisture_sensor)
-            if state and state.state not in ("unknown", "unavailable"):
-                try:
-                    moisture = float(state.state)
-                    if moisture >= self.soil_moisture_threshold:
-                        _LOGGER.info(f"{self.controller_mac_address} - Soil moisture is {moisture}%, above threshold ({self.soil_moisture_threshold}%). Skipping watering.")
-                        return
-                    else:
-                        _LOGGER.debug(f"{self.controller_mac_address} - Soil moisture is {moisture}%, below threshold ({self.soil_moisture_threshold}%). Proceeding with watering.")
-                except ValueError:
-                    _LOGGER.warning(f"{self.controller_mac_address} - Failed to parse soil moisture value: {state.state}")
-            else:
-                _LOGGER.warning(f"{self.controller_mac_address} - Soil moisture sensor state is unknown or unavailable: {state.state if state else 'None'}")
-    
-        current_month_index = dt_util.now().month - 1
-        month_config = self.schedule[current_month_index]
-    
-        if not month_config:
+
+        if not self.compiled_schedule:
             _LOGGER.info(f"{self.controller_mac_address} - No configuration active for this month.")
             return
     
-        stations = month_config.get("stations", {})
+        month_schedule = self.compiled_schedule.month(dt_util.now().month)
+
+        # Soil moisture is cached from the sensor events, so wet days are skipped before any request
+        scheduled_stations = [
+            station_id for station_id, minutes in enumerate(month_schedule.station_minutes, start=1) if minutes > 0
+        ]
+        if scheduled_stations and all(self.is_station_soil_wet(station_id) for station_id in scheduled_stations):
+            _LOGGER.info(
+                f"{self.controller_mac_address} - Soil moisture above threshold ({self.soil_moisture_threshold}%) "
+                f"on all stations. Skipping watering."
+            )
+            return
+
+        await self.refresh_weather_for_decision()
     
-        for station_key, scheduled_minutes in stations.items():
-            if not isinstance(scheduled_minutes, int) or scheduled_minutes <= 0:
+        for station_id in scheduled_stations:
+            if self.station_soil_moisture_sensors[station_id - 1] and self.station_soil_moisture(station_id) is None:
+                _LOGGER.warning(
+                    f"{self.controller_mac_address} - Soil moisture sensor {self.station_soil_moisture_sensors[station_id - 1]} "
+                    f"state is unknown or unavailable."
+                )
+            elif self.is_station_soil_wet(station_id):
+                _LOGGER.info(
+                    f"{self.controller_mac_address} - Soil moisture of station {station_id} is {self.station_soil_moisture(station_id)}%, "
+                    f"above threshold ({self.soil_moisture_threshold}%). Skipping station."
+                )
                 continue
-    
-            station_id = int(station_key.replace("station_", "").replace("_minutes", ""))
+
+            self.update_watering_amounts()
             target_mm = self.sprinkle_target_amount_today[station_id - 1]
             already_applied_mm = self.sprinkle_total_amount_today[station_id - 1]
             rain_mm = self.rain_total_amount_forecasted_today
-            remaining_mm = max(0.0, target_mm - (already_applied_mm + rain_mm))
+            remaining_mm = self.watering_amounts.remaining[station_id - 1]
     
             _LOGGER.debug(
                 f"{self.controller_mac_address} - Station {station_id}: Target={target_mm}mm, "
@@ -622,21 +812,69 @@ class SolemCoordinator(DataUpdateCoordinator):
                 _LOGGER.info(f"{self.controller_mac_address} - Station {station_id} already received enough water.")
                 continue
     
-            flow_rate = self.water_flow_rate[station_id - 1]  # L/min
-            area = self.station_areas[station_id - 1] or 1  # m²
-            mm_per_minute = flow_rate / area
+            # L/min on m²
+            station_mm_per_minute = mm_per_minute(self.water_flow_rate[station_id - 1], self.station_areas[station_id - 1])
     
-            minutes_needed = int((remaining_mm / mm_per_minute) + 0.999)
+            minutes_needed = int((remaining_mm / station_mm_per_minute) + 0.999)
     
             if minutes_needed > 0:
                 _LOGGER.info(
                     f"{self.controller_mac_address} - Station {station_id} will irrigate for {minutes_needed} min "
-                    f"to apply {remaining_mm:.2f}mm (mm/min={mm_per_minute:.2f})"
+                    f"to apply {remaining_mm:.2f}mm (mm/min={station_mm_per_minute:.2f})"
                 )
-                await self.start_irrigation(station_id, minutes_needed)
+                # The run is cut off by the soil moisture events of the station
+                self._soil_gated_station = station_id
+                try:
+                    await self.start_irrigation(station_id, minutes_needed)
+                finally:
+                    self._soil_gated_station = None
 
 
     
+    async def update_weather_state(self):
+        """Read weather indicators from the (cached) weather API."""
+        if self.weather_api:
+            self.weather_api.set_decision_times(
+                self.get_weather_decision_times(),
+                active=any(station.state == "Sprinkling" for station in self.stations),
+            )
+            # The weather API serves stale data during outages; it only raises when
+            # nothing was ever fetched, in which case the last known values are kept.
+            try:
+                will_it_rain_result = await self.weather_api.will_it_rain()
+                self.will_it_rain_today = will_it_rain_result.get("will_rain", False)
+                self.will_it_rain_today_forecast = will_it_rain_result.get("forecast", [])
+            except APIConnectionError as ex:
+                _LOGGER.warning(f"{self.controller_mac_address} - Forecast unavailable, keeping last known values: {ex}")
+            # With a local rain sensor, is_raining_now is pushed by its state changes; a
+            # rain detector still needs the current weather for the rain amounts
+            if not self.rain_sensor_measures_amount:
+                try:
+                    is_raining_result = await self.weather_api.is_raining()
+                    if not self.rain_sensor:
+                        self.is_raining_now = is_raining_result["is_raining"]
+                    self.is_raining_now_json = is_raining_result["current"]
+                except APIConnectionError as ex:
+                    _LOGGER.warning(f"{self.controller_mac_address} - Current weather unavailable, keeping last known values: {ex}")
+            self.weather_status = self.weather_api.get_cache_status()
+        else:
+            self.will_it_rain_today = False
+            self.will_it_rain_today_forecast = []
+            if not self.rain_sensor:
+                self.is_raining_now = False
+                self.is_raining_now_json = {}
+            self.weather_status = {}
+
+    async def refresh_weather_for_decision(self):
+        """Bring weather data up to date right before a watering decision."""
+        if not self.weather_api:
+            return
+        await self.weather_api.refresh_for_decision()
+        await self.update_weather_state()
+        self.rain_total_amount_forecasted_today = (
+            await self.get_total_rain_forecast_for_today()
+        ) + self.rain_total_amount_today
+
     async def async_update_all_sensors(self):
         _LOGGER.debug(f"{self.controller_mac_address} - Updating all sensors...")
 
@@ -656,48 +894,164 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.last_reset = ensure_datetime(self.last_reset)
             if self.last_reset is None or self.last_reset.date() != now.date():
                 await self.reset_rain_sprinkle_indicators()
-                
-        data = []
-        
-        counter = 1
-        forecast_sprinkle_counter = 501
-        sprinkle_counter = 601
-        water_flow_counter = 701
-        stations_counter = 801
-        buttons_counter = 901
-        
-        if self.weather_api:
-            will_it_rain_result = await self.weather_api.will_it_rain()
-            self.will_it_rain_today = will_it_rain_result.get("will_rain", False)
-            self.will_it_rain_today_forecast = will_it_rain_result.get("forecast", [])
-            is_raining_result = await self.weather_api.is_raining()
-            self.is_raining_now = is_raining_result["is_raining"]
-            self.is_raining_now_json = is_raining_result["current"]
+
+        await self.update_weather_state()
+        if self.rain_sensor_measures_amount:
+            # Rain amounts are measured by the rain sensor and pushed on its state changes
+            self.refresh_rain_sensor_state()
         else:
-            self.will_it_rain_today = False
-            self.will_it_rain_today_forecast = []
-            self.is_raining_now = False
-            self.is_raining_now_json = {}
+            # A rain detector only tells whether it rains, the amounts come from the weather provider
+            self.account_weather_rain()
+
         if self.is_raining_now:
-            self.has_rained_today = True
-            self.last_rain = dt_util.now()
-            self.rain_time_today += self.poll_interval / 60
-            self.rain_total_amount_today += await self.calculate_rain_amount()
-
-            if not self.sprinkle_with_rain:
-                for station_id in range(1, self.num_stations + 1):
-                    if self.stations[station_id - 1].state == "Sprinkling":
-                        self.stop_irrigation()
-                        break
+            self.stop_irrigation_for_rain()
         
         if self.weather_api:
             self.rain_total_amount_forecasted_today = (
-                await self.weather_api.get_total_rain_forecast_for_today()
+                await self.get_total_rain_forecast_for_today()
             ) + self.rain_total_amount_today
         else:
             self.rain_total_amount_forecasted_today = self.rain_total_amount_today
 
         self.next_schedule = await self.get_next_watering_date()
+        self.apply_poll_policy()
+
+        data = self.build_sensor_data()
+
+        # Save persistent data
+        await self.save_persistent_data()
+        _LOGGER.debug(f"{self.controller_mac_address} - Updated sensors.")
+        return data
+
+    def select_poll_policy(self) -> tuple[str, int]:
+        """Polling policy for the current controller and weather state, with its interval in seconds."""
+        if self.is_raining_now or any(station.state == "Sprinkling" for station in self.stations):
+            return POLL_POLICY_ACTIVE, self.poll_interval
+
+        now = dt_util.now()
+        if (
+            self.controller.state == "Off"
+            or not self.compiled_schedule
+            or not self.compiled_schedule.month(now.month).waters
+        ):
+            return POLL_POLICY_DORMANT, max(self.poll_interval, POLL_DORMANT_INTERVAL)
+
+        plan = self.scheduler.plan
+        next_watering = plan.next_watering(now) if plan else None
+        lead = timedelta(minutes=POLL_PRE_CYCLE_LEAD_MINUTES)
+        if next_watering and next_watering - now <= lead:
+            return POLL_POLICY_PRE_CYCLE, max(self.poll_interval, POLL_PRE_CYCLE_INTERVAL)
+
+        interval = POLL_IDLE_INTERVAL
+        if next_watering:
+            # Wake up in time for the pre cycle window
+            interval = min(interval, int((next_watering - lead - now).total_seconds()))
+        return POLL_POLICY_IDLE, max(self.poll_interval, interval)
+
+    def polling_status(self) -> dict[str, Any]:
+        """Current polling policy and interval, for diagnostics and the status service."""
+        return {
+            "policy": self.poll_policy,
+            "interval_seconds": self.update_interval.total_seconds() if self.update_interval else None,
+            "scan_interval_seconds": self.poll_interval,
+        }
+
+    def apply_poll_policy(self) -> None:
+        """Adapt the update interval to the current state."""
+        if self.event_driven:
+            # No periodic update: state is pushed on events, weather is refreshed when it expires
+            self.poll_policy = POLL_POLICY_EVENT_DRIVEN
+            self.update_interval = None
+            if self.weather_api:
+                # A run starting shortens the weather refresh interval
+                self.weather_api.set_decision_times(
+                    self.get_weather_decision_times(),
+                    active=any(station.state == "Sprinkling" for station in self.stations),
+                )
+            self._arm_weather_refresh()
+            return
+
+        # Polling again: the periodic update refreshes the weather
+        self._cancel_weather_refresh()
+        policy, seconds = self.select_poll_policy()
+        if policy != self.poll_policy:
+            _LOGGER.debug(f"{self.controller_mac_address} - Polling policy {policy}, every {seconds}s.")
+        self.poll_policy = policy
+        self.update_interval = timedelta(seconds=seconds)
+
+    def _arm_weather_refresh(self) -> None:
+        """Arm the single timer refreshing the weather in event driven mode.
+
+        A pending refresh is only replaced by an earlier one (e.g. once a station
+        sprinkles), so frequent local refreshes never postpone it.
+        """
+        if not self.weather_api:
+            return
+        delay = max(self.weather_api.get_refresh_interval(), timedelta(seconds=self.poll_interval))
+        refresh_at = dt_util.utcnow() + delay
+        if self._unsub_weather_refresh:
+            if self._weather_refresh_at <= refresh_at:
+                return
+            self._unsub_weather_refresh()
+        self._weather_refresh_at = refresh_at
+        self._unsub_weather_refresh = async_call_later(self.hass, delay, self._async_weather_refresh)
+
+    def _cancel_weather_refresh(self) -> None:
+        if self._unsub_weather_refresh:
+            self._unsub_weather_refresh()
+            self._unsub_weather_refresh = None
+            self._weather_refresh_at = None
+
+    async def _async_weather_refresh(self, _now) -> None:
+        """Refresh the weather inputs only; storage is written only when it rained."""
+        self._unsub_weather_refresh = None
+        self._weather_refresh_at = None
+        last_rain = self.last_rain
+        await self.update_weather_state()
+        if not self.rain_sensor_measures_amount:
+            self.account_weather_rain()
+        self.rain_total_amount_forecasted_today = (
+            await self.get_total_rain_forecast_for_today()
+        ) + self.rain_total_amount_today
+        self.next_schedule = await self.get_next_watering_date()
+        if self.last_rain != last_rain:
+            await self.save_persistent_data()
+        # Re-arms the weather timer
+        self.async_refresh_local_state()
+
+    @callback
+    def async_push_state(self) -> None:
+        """Republish the in-memory state to the entities, without any I/O."""
+        data = self.build_sensor_data()
+        if self.update_interval is None:
+            self.async_set_updated_data(data)
+        else:
+            # Frequent pushes (e.g. a rain gauge) must not keep postponing the next poll
+            self.data = data
+            self.async_update_listeners()
+
+    @callback
+    def async_refresh_local_state(self) -> None:
+        """Publish the state changed by a command right away.
+
+        Unlike a full update nothing is fetched nor saved: the sensor data is
+        rebuilt from memory and the polling policy adapted to the new state.
+        """
+        self.apply_poll_policy()
+        # Also reschedules the next poll with the adapted interval
+        self.async_set_updated_data(self.build_sensor_data())
+
+    def build_sensor_data(self) -> list[dict[str, Any]]:
+        """Build the coordinator data from the current in-memory state, without any I/O."""
+        self.update_watering_amounts()
+        data = []
+        
+        counter = 1
+        forecast_sprinkle_counter = 501
+        sprinkle_counter = 601
+        water_flow_counter = 701
+        stations_counter = 801
+        buttons_counter = 901
 
         # Controller
         data.append({
@@ -936,14 +1290,28 @@ class SolemCoordinator(DataUpdateCoordinator):
         })
         counter += 1
 
-        # Save persistent data
-        await self.save_persistent_data()
-        _LOGGER.debug(f"{self.controller_mac_address} - Updated sensors.")
+        if self.weather_api and self.weather_api.budget:
+            data.append({
+                "device_id": f"{self.controller_mac_address}_weather_api_calls_today",
+                "device_type": "WEATHER_API_CALLS_SENSOR",
+                "device_name": "OpenWeatherMap API calls today",
+                "device_uid": mac_to_uuid(self.controller_mac_address, counter),
+                "software_version": "1.0",
+                "state": self.weather_api.budget.calls_today,
+                "icon": "mdi:api",
+                "last_reboot": None,
+            })
+            counter += 1
+
         return data
 
     async def async_update_data(self):
         data = []
 
+        # Persisted state (including the weather cache) must be restored before the
+        # first refresh, otherwise a restart would always hit the weather API.
+        await self.storage_loaded.wait()
+
         try:
             data = await self.async_update_all_sensors()
         except Exception as err:
@@ -954,32 +1322,251 @@ class SolemCoordinator(DataUpdateCoordinator):
         return data
 
 
-    async def calculate_rain_amount(self) -> float:
-        if "rain" not in self.is_raining_now_json:
-            return 0.0  # No rain
-    
-        rain_data = self.is_raining_now_json["rain"]
-        
-        for key in rain_data:
-            if key.endswith("h") and key[:-1].isdigit():
-                hours = int(key[:-1])  # Extract the number of hours
-                rain_amount = rain_data[key]  # Amount of water during this period
-                minutes = hours * 60  # Convert from hours to minutes
-                return (rain_amount / minutes) * (self.poll_interval / 60)  # Returns the amount of water for the polling frequency
+    def get_weather_decision_times(self) -> list[datetime]:
+        """Moments at which watering decisions read weather data: next midnight and today's watering hours."""
+        now = dt_util.now()
+        decision_times = [dt_util.start_of_local_day(now + timedelta(days=1))]
+        if self.compiled_schedule:
+            for hour in self.compiled_schedule.month(now.month).hours:
+                decision_times.append(dt_util.as_local(datetime.combine(now.date(), hour)))
+        return decision_times
+
+    async def get_total_rain_forecast_for_today(self) -> float:
+        """Rain forecast for the rest of today, falling back to the last known value."""
+        try:
+            return await self.weather_api.get_total_rain_forecast_for_today()
+        except APIConnectionError as ex:
+            _LOGGER.warning(f"{self.controller_mac_address} - Forecast unavailable, keeping last known rain forecast: {ex}")
+            return max(0.0, (self.rain_total_amount_forecasted_today or 0) - (self.rain_total_amount_today or 0))
+
+    def setup_rain_sensor(self):
+        """Subscribe to the local rain sensor / gauge, if one is configured."""
+        if self._unsub_rain_sensor:
+            self._unsub_rain_sensor()
+            self._unsub_rain_sensor = None
+        if not self.rain_sensor:
+            return
 
-        return 0.0  # In case there are no recognizable keys
+        _LOGGER.info(f"{self.controller_mac_address} - Listening to rain sensor {self.rain_sensor}...")
+        self._unsub_rain_sensor = async_track_state_change_event(
+            self.hass, [self.rain_sensor], self._handle_rain_sensor_event
+        )
+        self._apply_rain_sensor_state(self.hass.states.get(self.rain_sensor))
+
+    @callback
+    def _handle_rain_sensor_event(self, event: Event) -> None:
+        self._apply_rain_sensor_state(event.data.get("new_state"))
+        self.async_push_state()
+
+    def _apply_rain_sensor_state(self, state) -> None:
+        """Update rain indicators from a rain sensor state.
+
+        Supports a binary rain detector, a rain rate sensor (unit per hour or day,
+        integrated over time) and a cumulative rain gauge (increments are added to
+        today's total). Amounts in cm or inches are converted to mm.
+        """
+        if state is None or state.state in ("unknown", "unavailable"):
+            return
+        now = dt_util.now()
+
+        if state.domain == "binary_sensor":
+            raining = state.state == "on"
+        else:
+            try:
+                value = float(state.state)
+            except ValueError:
+                _LOGGER.warning(f"{self.controller_mac_address} - Failed to parse rain sensor value: {state.state}")
+                return
+            unit = state.attributes.get("unit_of_measurement") or ""
+            depth_unit, _, period = unit.partition("/")
+            to_mm = RAIN_SENSOR_UNITS_MM.get(depth_unit.strip())
+            if to_mm is None or period not in ("", "h", "d"):
+                _LOGGER.warning(f"{self.controller_mac_address} - Unsupported rain sensor unit: {unit}")
+                return
+            value *= to_mm
+            if period:
+                # Rates are integrated per hour
+                rate = value / 24 if period == "d" else value
+                self.rain_total_amount_today += self._sensor_rain_rate.observe(rate, state.last_updated.timestamp())
+                raining = value > 0
+            else:
+                if self._rain_gauge_value is not None:
+                    # A gauge going down was reset; its new value is all new rain
+                    delta = value - self._rain_gauge_value if value >= self._rain_gauge_value else value
+                    if delta > 0:
+                        self.rain_total_amount_today += delta
+                        self._rain_gauge_last_increment = now
+                self._rain_gauge_value = value
+                raining = self._rain_gauge_raining(now)
+
+        self._set_raining_now(raining, now)
+
+    def _rain_gauge_raining(self, now: datetime) -> bool:
+        last_increment = self._rain_gauge_last_increment
+        return last_increment is not None and now - last_increment < timedelta(minutes=RAIN_GAUGE_DRY_MINUTES)
+
+    def _set_raining_now(self, raining: bool, now: datetime) -> None:
+        # Rain time is accounted for the period that just ended (monotonic, the mark is only set while raining)
+        mark = time.monotonic()
+        if self._rain_time_mark is not None:
+            self.rain_time_today += (mark - self._rain_time_mark) / 60
+        self._rain_time_mark = mark if raining else None
+
+        self.is_raining_now = raining
+        if raining:
+            self.has_rained_today = True
+            self.last_rain = now
+            self.stop_irrigation_for_rain()
+
+    def refresh_rain_sensor_state(self) -> None:
+        """Account rain time and rate up to now; a gauge without increments dries out."""
+        now = dt_util.now()
+        self.rain_total_amount_today += self._sensor_rain_rate.advance()
+        raining = self.is_raining_now
+        if self._rain_gauge_value is not None:
+            raining = self._rain_gauge_raining(now)
+        self._set_raining_now(raining, now)
+
+    def stop_irrigation_for_rain(self) -> None:
+        """Stop an active run when it rains and sprinkling with rain is disabled."""
+        if self.sprinkle_with_rain or (self._rain_stop_task and not self._rain_stop_task.done()):
+            return
+        if any(station.state == "Sprinkling" for station in self.stations):
+            _LOGGER.info(f"{self.controller_mac_address} - It is raining, stopping watering...")
+            self._rain_stop_task = self.hass.async_create_task(self.stop_irrigation())
+
+    def setup_soil_moisture_sensors(self):
+        """Subscribe to the soil moisture sensors of the stations, caching their values."""
+        if self._unsub_soil_moisture:
+            self._unsub_soil_moisture()
+            self._unsub_soil_moisture = None
+
+        # Stations without a sensor of their own use the controller one
+        station_sensors = self.config_entry.data.get(STATION_SOIL_MOISTURE_SENSORS) or []
+        self.station_soil_moisture_sensors = [
+            (station_sensors[index] if index < len(station_sensors) else None) or self.soil_moisture_sensor
+            for index in range(self.num_stations)
+        ]
+        self._soil_moisture = {}
+        entity_ids = sorted({entity_id for entity_id in self.station_soil_moisture_sensors if entity_id})
+        if not entity_ids:
+            return
+
+        _LOGGER.info(f"{self.controller_mac_address} - Listening to soil moisture sensors {entity_ids}...")
+        self._unsub_soil_moisture = async_track_state_change_event(
+            self.hass, entity_ids, self._handle_soil_moisture_event
+        )
+        for entity_id in entity_ids:
+            self._apply_soil_moisture_state(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def _handle_soil_moisture_event(self, event: Event) -> None:
+        self._apply_soil_moisture_state(event.data["entity_id"], event.data.get("new_state"))
+        self.stop_irrigation_for_soil_moisture()
+
+    def _apply_soil_moisture_state(self, entity_id: str, state) -> None:
+        moisture = None
+        if state and state.state not in ("unknown", "unavailable"):
+            try:
+                moisture = float(state.state)
+            except ValueError:
+                _LOGGER.warning(f"{self.controller_mac_address} - Failed to parse soil moisture value: {state.state}")
+        self._soil_moisture[entity_id] = moisture
+
+    def station_soil_moisture(self, station_id: int) -> float | None:
+        """Last known soil moisture (%) of a station, None without a (valid) sensor."""
+        if station_id > len(self.station_soil_moisture_sensors):
+            return None
+        entity_id = self.station_soil_moisture_sensors[station_id - 1]
+        return self._soil_moisture.get(entity_id) if entity_id else None
+
+    def is_station_soil_wet(self, station_id: int) -> bool:
+        moisture = self.station_soil_moisture(station_id)
+        return moisture is not None and moisture >= self.soil_moisture_threshold
+
+    def stop_irrigation_for_soil_moisture(self) -> None:
+        """Stop the scheduled run of a station as soon as its soil is wet enough."""
+        station_id = self._soil_gated_station
+        if station_id is None or (self._soil_stop_task and not self._soil_stop_task.done()):
+            return
+        if self.stations[station_id - 1].state == "Sprinkling" and self.is_station_soil_wet(station_id):
+            _LOGGER.info(
+                f"{self.controller_mac_address} - Soil moisture of station {station_id} reached "
+                f"{self.station_soil_moisture(station_id)}%, stopping watering..."
+            )
+            self._soil_stop_task = self.hass.async_create_task(self.stop_irrigation())
+
+    async def async_shutdown(self) -> None:
+        """Cancel listeners and timers when the config entry is unloaded."""
+        self.scheduler.async_cancel()
+        # Runs still waiting for the site flow limits are cancelled with the limits
+        self.site_scheduler.unregister(self.config_entry.entry_id)
+        if self.weather_api:
+            self.weather_api.async_cancel()
+        self._cancel_weather_refresh()
+        if self._unsub_soil_moisture:
+            self._unsub_soil_moisture()
+            self._unsub_soil_moisture = None
+        if self._unsub_rain_sensor:
+            self._unsub_rain_sensor()
+            self._unsub_rain_sensor = None
+        await super().async_shutdown()
+
+    @property
+    def rain_sensor_measures_amount(self) -> bool:
+        """Whether the rain sensor gives amounts (rate or gauge), not only rain detection."""
+        return bool(self.rain_sensor) and not self.rain_sensor.startswith("binary_sensor.")
+
+    def account_weather_rain(self) -> None:
+        """Integrate the weather provider's rain rate over the time actually elapsed.
+
+        Independent of the poll interval: a cached observation is not counted twice
+        and stops counting one hour after it was made.
+        """
+        current = self.is_raining_now_json or {}
+        rate = (current.get("rain") or {}).get("1h", 0.0) if self.is_raining_now else 0.0
+        self.rain_total_amount_today += self._weather_rain_rate.observe(rate, current.get("dt"))
+        self._set_raining_now(self.is_raining_now, dt_util.now())
 
     def calculate_forecasted_sprinkle_today(self, station_id: int) -> float:
         """Calcula a quantidade de mm prevista de rega para hoje para uma estação específica."""
-        target_mm = self.sprinkle_target_amount_today[station_id - 1]
-        applied_mm = self.sprinkle_total_amount_today[station_id - 1]
-        forecasted_rain = self.rain_total_amount_forecasted_today
-    
-        remaining_mm = max(0.0, target_mm - (applied_mm + forecasted_rain))
-        return round(remaining_mm, 2)
+        return round(self.watering_amounts.remaining[station_id - 1], 2)
 
     async def start_irrigation(self, station: int, minutes: int | None = None):
         duration = int(minutes if minutes is not None else self.irrigation_manual_duration)
+        # A previous stop must not cancel this run (nor the rest of a sequence started after it)
+        self.irrigation_stop_event.clear()
+
+        # The valve is opened within the flow limits of the site (supply line shared with other controllers)
+        lease = self.site_scheduler.request(
+            self.config_entry.entry_id, self.controller_mac_address, self.water_flow_rate[station - 1], duration
+        )
+        try:
+            if not lease.granted:
+                _LOGGER.info(f"{self.controller_mac_address} - Station {station} waiting for the site flow limits...")
+                stop_wait = asyncio.ensure_future(self.irrigation_stop_event.wait())
+                try:
+                    await asyncio.wait({lease.future, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    stop_wait.cancel()
+                if not lease.granted:
+                    _LOGGER.info(f"{self.controller_mac_address} - Watering on station {station} canceled while waiting.")
+                    return
+                # Rain and soil moisture may have changed during the wait
+                if self.is_raining_now and not self.sprinkle_with_rain:
+                    _LOGGER.info(f"{self.controller_mac_address} - Started raining while station {station} waited, skipping.")
+                    return
+                if station == self._soil_gated_station and self.is_station_soil_wet(station):
+                    _LOGGER.info(
+                        f"{self.controller_mac_address} - Soil moisture of station {station} reached "
+                        f"{self.station_soil_moisture(station)}% while waiting, skipping."
+                    )
+                    return
+            await self._async_sprinkle_station(station, duration)
+        finally:
+            lease.release()
+
+    async def _async_sprinkle_station(self, station: int, duration: int):
         _LOGGER.info(f"{self.controller_mac_address} - Going to start watering on station {station} for {duration} minutes...")
         
         try:
@@ -989,25 +1576,34 @@ class SolemCoordinator(DataUpdateCoordinator):
             return
         
         self.stations[station - 1].state = "Sprinkling"
-        data = await self.async_update_all_sensors()
-        if data is not None:  # Update only if data is valid
-            self.async_set_updated_data(data)
-        else:
-            _LOGGER.warning(f"{self.controller_mac_address} - async_update_all_sensors() returned None, skipping update.")
+        self.async_refresh_local_state()
 
-        for _ in range(duration * 60):
+        # Water is accounted for the time actually elapsed, not per loop iteration
+        watering_timer = ElapsedTimer()
+        remaining_seconds = duration * 60
+        since_push = 0.0
+        while remaining_seconds > 0:
             # Verify if exit condition is met
             if self.irrigation_stop_event.is_set():
                 _LOGGER.info(f"{self.controller_mac_address} - Irrigation cancelation triggered.")
                 break
-            await sleep(1)  # Validate every second
-            self.total_water_consumption += (self.water_flow_rate[station - 1] / 60)
+            await sleep(min(1, remaining_seconds))  # Validate every second
+            elapsed = watering_timer.elapsed()
+            remaining_seconds -= elapsed
+            minutes = elapsed / 60
+            self.total_water_consumption += self.water_flow_rate[station - 1] * minutes
             
             # Calculate mm of water applied
-            flow_rate = self.water_flow_rate[station - 1]  # L/min
-            area = self.station_areas[station - 1] or 1  # m², avoid division by zero
-            mm_per_minute = flow_rate / area  # mm/min
-            self.sprinkle_total_amount_today[station - 1] += mm_per_minute / 60  # mm per second
+            self.sprinkle_total_amount_today[station - 1] += (
+                mm_per_minute(self.water_flow_rate[station - 1], self.station_areas[station - 1]) * minutes
+            )
+
+            if self.event_driven:
+                # Without polling, progress is pushed every minute
+                since_push += elapsed
+                if since_push >= 60:
+                    since_push = 0.0
+                    self.async_push_state()
 
         else:  # Só entra aqui se o loop terminar normalmente (sem interrupção)
             self.stations[station - 1].state = "Stopped"
@@ -1015,12 +1611,11 @@ class SolemCoordinator(DataUpdateCoordinator):
         
         now = dt_util.now()
         self.last_sprinkle = now
-    
-        data = await self.async_update_all_sensors()
-        if data is not None:  # Update only if data is valid
-            self.async_set_updated_data(data)
-        else:
-            _LOGGER.warning(f"{self.controller_mac_address} - async_update_all_sensors() returned None, skipping update.")
+        # The last sprinkle moves the next watering date
+        self.next_schedule = await self.get_next_watering_date()
+        self.async_refresh_local_state()
+        # Water totals of the session are persisted once published
+        await self.save_persistent_data()
 
     async def stop_irrigation(self):
         _LOGGER.info(f"{self.controller_mac_address} - Stopping watering...")
@@ -1037,8 +1632,7 @@ class SolemCoordinator(DataUpdateCoordinator):
             self.stations[station_id - 1].state = "Stopped"
 
         _LOGGER.info(f"{self.controller_mac_address} - Stopped watering.")
-        data = await self.async_update_all_sensors()
-        self.async_set_updated_data(data)
+        self.async_refresh_local_state()
     
     async def turn_controller_on(self):
         _LOGGER.info(f"{self.controller_mac_address} - Turning irrigation controller on...")
@@ -1051,8 +1645,7 @@ class SolemCoordinator(DataUpdateCoordinator):
         
         self.controller.state = "On"
         
-        data = await self.async_update_all_sensors()
-        self.async_set_updated_data(data)
+        self.async_refresh_local_state()
         _LOGGER.info(f"{self.controller_mac_address} - Irrigation controller turned on.")
     
     async def turn_controller_off(self):
@@ -1065,25 +1658,78 @@ class SolemCoordinator(DataUpdateCoordinator):
 
         self.controller.state = "Off"
 
-        data = await self.async_update_all_sensors()
-        self.async_set_updated_data(data)
+        self.async_refresh_local_state()
         _LOGGER.info(f"{self.controller_mac_address} - Irrigation controller turned off.")
 
 
     async def async_set_schedule(self, new_schedule):
         """Replaces irrigation schedule from frontend card"""
+        try:
+            compiled_schedule = CompiledSchedule.compile(new_schedule, self.num_stations)
+        except ScheduleError as ex:
+            raise HomeAssistantError(f"Invalid schedule: {ex}") from ex
         
         # Atualiza a variável interna para refletir a nova configuração
         self.schedule = new_schedule
+        self.compiled_schedule = compiled_schedule
         
+        await self.async_schedule_changed(affects_today=True)
         await self.save_persistent_data()
 
-        # Atualiza os sensores
-        data = await self.async_update_all_sensors()
-        self.async_set_updated_data(data)
-
         _LOGGER.info(f"{self.controller_mac_address} - Updated schedule.")
 
+    async def async_patch_schedule(
+        self,
+        month: int,
+        interval_days: int | None = None,
+        hours: list[str] | None = None,
+        stations: dict[int, int] | None = None,
+    ):
+        """Change part of one month of the schedule (interval, hours and/or station minutes)."""
+        if not self.compiled_schedule:
+            raise HomeAssistantError("Schedule not initialized yet")
+        # Only the delta is validated, the rest of the schedule was validated when set
+        invalid_stations = [station for station in (stations or {}) if not 1 <= station <= self.num_stations]
+        if invalid_stations:
+            raise HomeAssistantError(f"Invalid station(s) {invalid_stations}, this controller has {self.num_stations}")
+
+        month_config = dict(self.schedule[month - 1])
+        if interval_days is not None:
+            month_config["interval_days"] = interval_days
+        if hours is not None:
+            month_config["hours"] = hours
+        if stations:
+            month_config["stations"] = dict(month_config.get("stations") or {})
+            for station, minutes in stations.items():
+                month_config["stations"][f"station_{station}_minutes"] = minutes
+        try:
+            month_schedule = MonthSchedule.compile(month_config, self.num_stations)
+        except ScheduleError as ex:
+            raise HomeAssistantError(f"Invalid schedule for month {month}: {ex}") from ex
+
+        self.schedule[month - 1] = month_config
+        self.compiled_schedule = self.compiled_schedule.replace_month(month, month_schedule)
+
+        await self.async_schedule_changed(affects_today=month == dt_util.now().month)
+        await self.save_persistent_data()
+
+        _LOGGER.info(f"{self.controller_mac_address} - Patched schedule for month {month}.")
+
+    async def async_schedule_changed(self, affects_today: bool):
+        """Recompute the values derived from the schedule and push them to the entities.
+
+        Weather and rain indicators do not depend on the schedule, so nothing is fetched.
+        """
+        if affects_today:
+            # A watering day stays one after its first sprinkles; a rest day stays one too
+            self.sprinkle_minutes_today = await self.calculate_sprinkle_minutes_today(
+                exclude_today=any(self.sprinkle_minutes_today)
+            )
+        self.next_schedule = await self.get_next_watering_date()
+        self.async_refresh_local_state()
+        # Today's plan may have changed; it is decided with the weather already known
+        await self.scheduler.async_rearm(refresh_weather=False)
+
     
     async def initialize_schedule(self):
         """Initialize the schedule if not already set"""
@@ -1107,6 +1753,7 @@ class SolemCoordinator(DataUpdateCoordinator):
             ]
     
             self.schedule = new_schedule
+            self.compile_schedule()
     
             # Saves new schedule on storage
             await self.save_persistent_data()
@@ -1133,8 +1780,141 @@ class SolemCoordinator(DataUpdateCoordinator):
             # Saves the schedule on storage
             await self.save_persistent_data()
 
+        self.compile_schedule()
         _LOGGER.info(f"{self.controller_mac_address} - Schedule initialized.")
 
+    def compile_schedule(self):
+        """Validate and compile the stored schedule; an invalid schedule disables scheduled watering."""
+        self.compiled_schedule = None
+        if not self.schedule:
+            return
+        try:
+            self.compiled_schedule = CompiledSchedule.compile(self.schedule, self.num_stations)
+        except ScheduleError as ex:
+            _LOGGER.error(f"{self.controller_mac_address} - Invalid schedule, scheduled watering disabled: {ex}")
+
+    # ----------------------------------------------------------------------------
+    # Read models returned by the response services (see __init__.py)
+    # ----------------------------------------------------------------------------
+    async def async_propose_schedule(
+        self,
+        month: int,
+        weekly_mm: list[float],
+        daily_rain: list[float] | None = None,
+        days: int = 91,
+        rain_probability: float = 0.25,
+        mean_rain_mm: float = 5.0,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
+        """Propose a month schedule meeting the weekly water needs with the fewest sessions.
+
+        The season is simulated over the given daily rain (historical) or over
+        synthetic rain; the current flow rates and station areas are used. The
+        schedule is only proposed, patch_irrigation_schedule applies it.
+        """
+        if len(weekly_mm) == 1:
+            weekly_mm = weekly_mm * self.num_stations
+        if len(weekly_mm) != self.num_stations:
+            raise HomeAssistantError(f"weekly_mm needs 1 or {self.num_stations} values, got {len(weekly_mm)}")
+        station_mm_per_minute = [
+            mm_per_minute(flow, area) for flow, area in zip(self.water_flow_rate, self.station_areas)
+        ]
+        if not any(rate > 0 for rate in station_mm_per_minute):
+            raise HomeAssistantError("No station has a water flow rate to simulate")
+        try:
+            daily_rain, proposal = await self.hass.async_add_executor_job(
+                _propose_schedule_job,
+                daily_rain,
+                (days, rain_probability, mean_rain_mm, seed),
+                station_mm_per_minute,
+                weekly_mm,
+            )
+        except ImportError as ex:
+            raise HomeAssistantError(f"Proposing a schedule needs NumPy: {ex}") from ex
+
+        # The hours of the month are kept, completed with default ones when more are needed
+        hours = [hour.strftime("%H:%M") for hour in self.compiled_schedule.month(month).hours] if self.compiled_schedule else []
+        hours += [hour for hour in PROPOSED_SCHEDULE_HOURS if hour not in hours]
+        return {
+            "month": month,
+            "schedule": {
+                "interval_days": proposal.interval_days,
+                "hours": sorted(hours[: proposal.occurrences]),
+                "stations": {
+                    f"station_{station_id}_minutes": minutes
+                    for station_id, minutes in enumerate(proposal.station_minutes, start=1)
+                },
+            },
+            "simulation": {
+                "days": len(daily_rain),
+                "rain_mm": round(float(sum(daily_rain)), 1),
+                "watering_days": proposal.watering_days,
+                "sessions": proposal.sessions,
+                "water_mm": proposal.water_mm,
+                "deficit_mm": proposal.deficit_mm,
+            },
+        }
+
+    def get_schedule_response(self) -> dict[str, Any]:
+        """The irrigation schedule, as set by the frontend card."""
+        return {
+            "num_stations": self.num_stations,
+            "schedule": self.schedule or [],
+        }
+
+    def get_forecast_timeline_response(self) -> dict[str, Any]:
+        """The cached forecast blocks and the per day totals derived from them.
+
+        Only the data in memory is served: reading it never requests the weather.
+        """
+        forecast = self.weather_api.cached_forecast() if self.weather_api else None
+        if forecast is None:
+            return {"block_seconds": None, "blocks": [], "daily": [], "stale": True}
+        return {
+            "block_seconds": forecast.block_seconds,
+            "blocks": [
+                {"dt": timestamp, "pop": pop, "rain": rain}
+                for timestamp, pop, rain in forecast.as_blocks()
+            ],
+            "daily": forecast.rain_by_day(dt_util.now(), FORECAST_DAYS),
+            "stale": self.weather_api.get_cache_status().get("forecast", {}).get("stale", True),
+        }
+
+    def get_status_response(self) -> dict[str, Any]:
+        """Controller, station and rain status."""
+
+        def iso(value):
+            return value.isoformat() if isinstance(value, datetime) else value
+
+        return {
+            "controller": self.controller.state,
+            "next_schedule": iso(self.next_schedule),
+            "last_sprinkle": iso(self.last_sprinkle),
+            "last_rain": iso(self.last_rain),
+            "total_water_consumption": self.total_water_consumption,
+            "stations": [
+                {
+                    "station": station.station_number,
+                    "state": station.state,
+                    "sprinkled_today": self.sprinkle_total_amount_today[index],
+                    "target_today": self.sprinkle_target_amount_today[index],
+                    "forecasted_sprinkle_today": self.calculate_forecasted_sprinkle_today(station.station_number),
+                }
+                for index, station in enumerate(self.stations)
+            ],
+            "rain": {
+                "is_raining_now": self.is_raining_now,
+                "will_it_rain_today": self.will_it_rain_today,
+                "has_rained_today": self.has_rained_today,
+                "rain_time_today": self.rain_time_today,
+                "rain_total_amount_today": self.rain_total_amount_today,
+                "rain_total_amount_forecasted_today": self.rain_total_amount_forecasted_today,
+            },
+            "weather_status": self.weather_status,
+            "site": self.site_scheduler.status(),
+            "polling": self.polling_status(),
+        }
+
     # ----------------------------------------------------------------------------
     # Here we add some custom functions on our data coordinator to be called
     # from entity platforms to get access to the specific data they want.
@@ -0,0 +1,35 @@
+"""Diagnostics support for the integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from . import MyConfigEntry
+from .const import OPEN_WEATHER_MAP_API_KEY
+
+TO_REDACT = {OPEN_WEATHER_MAP_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: MyConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = config_entry.runtime_data.coordinator
+    scheduler = coordinator.scheduler
+    plan = scheduler.plan
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "polling": coordinator.polling_status(),
+        "scheduler": {
+            "day": plan.day.isoformat() if plan else None,
+            "watering_times": [when.isoformat() for when in plan.watering_times] if plan else [],
+            "next_event": scheduler.next_event.isoformat() if scheduler.next_event else None,
+        },
+        "site": coordinator.site_scheduler.status(),
+        "weather": coordinator.weather_status,
+    }
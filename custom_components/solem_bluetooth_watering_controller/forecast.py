@@ -0,0 +1,246 @@
+"""Compact weather records the weather providers are built on."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+FORECAST_BLOCK_SECONDS = 3 * 60 * 60
+# The free forecast endpoint returns 5 days of 3 hour blocks
+FORECAST_DAYS = 5
+
+
+def _parse_forecast_item(item: dict[str, Any], rain_key: str) -> tuple[int, float, float] | None:
+    """Return (epoch, pop, rain) for an OWM-shaped forecast item, or None if unusable."""
+    timestamp = item.get("dt")
+    if timestamp is None:
+        # Older persisted caches may only carry dt_txt (local time)
+        dt_txt = item.get("dt_txt")
+        if not dt_txt:
+            return None
+        try:
+            local_dt = dt_util.as_local(datetime.strptime(dt_txt, "%Y-%m-%d %H:%M:%S"))
+        except ValueError:
+            return None
+        timestamp = local_dt.timestamp()
+
+    rain = item.get("rain") or {}
+    return int(timestamp), float(item.get("pop") or 0.0), float(rain.get(rain_key) or 0.0)
+
+
+@dataclass(slots=True)
+class CurrentWeather:
+    """Current conditions, reduced to the fields the watering logic uses.
+
+    ``rain_1h`` is the rain rate (mm/h) while it rains and None otherwise. The
+    provider payload is only kept in ``raw`` when debugging payloads is enabled.
+    """
+
+    dt: int
+    condition: str | None = None
+    temperature: float | None = None
+    humidity: float | None = None
+    rain_1h: float | None = None
+    raw: dict[str, Any] | None = None
+
+    @property
+    def is_raining(self) -> bool:
+        return self.rain_1h is not None
+
+    @classmethod
+    def from_owm(cls, data: dict[str, Any], keep_raw: bool = False) -> CurrentWeather:
+        """Project an OWM current weather response."""
+        rain = data.get("rain")
+        rain_1h = None
+        if rain is not None:
+            # OWM reports the last hour, or the last 3 hours for some stations
+            rain_1h = float(rain["1h"]) if "1h" in rain else float(rain.get("3h") or 0.0) / 3
+        weather = data.get("weather") or [{}]
+        main = data.get("main") or {}
+        return cls(
+            dt=int(data["dt"]),
+            condition=(weather[0].get("main") or "").lower() or None,
+            temperature=main.get("temp"),
+            humidity=main.get("humidity"),
+            rain_1h=rain_1h,
+            raw=data if keep_raw else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CurrentWeather | None:
+        """Rebuild from as_dict output; raw OWM payloads stored by older versions are projected."""
+        if not isinstance(data, dict) or "dt" not in data:
+            return None
+        if "main" in data or "weather" in data:
+            return cls.from_owm(data)
+        rain = data.get("rain")
+        return cls(
+            dt=int(data["dt"]),
+            condition=data.get("condition"),
+            temperature=data.get("temperature"),
+            humidity=data.get("humidity"),
+            rain_1h=float(rain.get("1h") or 0.0) if rain is not None else None,
+        )
+
+    def as_dict(self, include_raw: bool = False) -> dict[str, Any]:
+        """OWM-shaped dict ("rain" present while it rains), for storage and attributes."""
+        current = {
+            "dt": self.dt,
+            "dt_txt": dt_util.as_local(dt_util.utc_from_timestamp(self.dt)).strftime("%Y-%m-%d %H:%M:%S"),
+            "condition": self.condition,
+            "temperature": self.temperature,
+            "humidity": self.humidity,
+        }
+        if self.rain_1h is not None:
+            current["rain"] = {"1h": round(self.rain_1h, 2)}
+        if include_raw and self.raw is not None:
+            current["raw"] = self.raw
+        return current
+
+
+class ForecastTimeline:
+    """Forecast blocks keyed by epoch timestamp.
+
+    Items are parsed once on ingest and only ``pop`` and the rain of the block
+    (``rain.3h`` for OWM) are kept. Prefix sums over rain and a sparse table over
+    pop answer the range queries used by the coordinator in O(log n).
+    """
+
+    def __init__(
+        self, items: list[dict[str, Any]] | None = None, block_seconds: int = FORECAST_BLOCK_SECONDS
+    ) -> None:
+        """Initialise."""
+        self.block_seconds = block_seconds
+        self._rain_key = f"{block_seconds // 3600}h"
+        self._blocks: dict[int, tuple[float, float]] = {}
+        self._timestamps: list[int] = []
+        self._pop: list[float] = []
+        self._rain: list[float] = []
+        self._rain_prefix: list[float] = [0.0]
+        self._pop_table: list[list[float]] = []
+        if items:
+            self.ingest(items)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def ingest(self, items: list[dict[str, Any]]) -> int:
+        """Merge OWM-shaped forecast items, replacing blocks with the same timestamp."""
+        parsed = [block for block in (_parse_forecast_item(item, self._rain_key) for item in items) if block]
+        return self.ingest_blocks(parsed)
+
+    def ingest_blocks(self, blocks: list[tuple[int, float, float]]) -> int:
+        """Merge (epoch, pop, rain) blocks, replacing blocks with the same timestamp."""
+        for timestamp, pop, rain in blocks:
+            self._blocks[timestamp] = (pop, rain)
+        self._rebuild()
+        return len(blocks)
+
+    def prune(self, before: datetime) -> None:
+        """Drop blocks that ended before the given moment."""
+        cutoff = before.timestamp() - self.block_seconds
+        stale = [timestamp for timestamp in self._timestamps if timestamp <= cutoff]
+        if not stale:
+            return
+        for timestamp in stale:
+            del self._blocks[timestamp]
+        self._rebuild()
+
+    def clear(self) -> None:
+        """Remove all blocks."""
+        self._blocks.clear()
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._timestamps = sorted(self._blocks)
+        self._pop = [self._blocks[timestamp][0] for timestamp in self._timestamps]
+        self._rain = [self._blocks[timestamp][1] for timestamp in self._timestamps]
+
+        self._rain_prefix = [0.0]
+        for rain in self._rain:
+            self._rain_prefix.append(self._rain_prefix[-1] + rain)
+
+        self._pop_table = [self._pop]
+        width = 1
+        while width * 2 <= len(self._pop):
+            previous = self._pop_table[-1]
+            self._pop_table.append(
+                [max(previous[i], previous[i + width]) for i in range(len(previous) - width)]
+            )
+            width *= 2
+
+    def _overlapping(self, start: datetime, end: datetime) -> tuple[int, int]:
+        """Index range of blocks overlapping [start, end)."""
+        if end <= start:
+            return 0, 0
+        lo = bisect_right(self._timestamps, start.timestamp() - self.block_seconds)
+        hi = bisect_left(self._timestamps, end.timestamp())
+        return lo, hi
+
+    def max_pop_between(self, start: datetime, end: datetime) -> float:
+        """Highest probability of precipitation among blocks overlapping [start, end)."""
+        lo, hi = self._overlapping(start, end)
+        if lo >= hi:
+            return 0.0
+        level = (hi - lo).bit_length() - 1
+        row = self._pop_table[level]
+        return max(row[lo], row[hi - (1 << level)])
+
+    def rain_between(self, start: datetime, end: datetime) -> float:
+        """Forecasted rain (mm) in [start, end), prorating partially covered blocks."""
+        lo, hi = self._overlapping(start, end)
+        if lo >= hi:
+            return 0.0
+
+        total = self._rain_prefix[hi] - self._rain_prefix[lo]
+
+        # Remove the parts of the edge blocks that fall outside the window
+        head = start.timestamp() - self._timestamps[lo]
+        if head > 0:
+            total -= self._rain[lo] * head / self.block_seconds
+        tail = self._timestamps[hi - 1] + self.block_seconds - end.timestamp()
+        if tail > 0:
+            total -= self._rain[hi - 1] * tail / self.block_seconds
+
+        return max(0.0, total)
+
+    def rain_by_day(self, start: datetime, days: int) -> list[dict[str, Any]]:
+        """Rain (mm) and highest pop per day, the first day starting at start."""
+        day_start = start
+        daily = []
+        for _ in range(days):
+            day_end = dt_util.start_of_local_day(day_start + timedelta(days=1))
+            daily.append({
+                "date": day_start.date().isoformat(),
+                "rain": round(self.rain_between(day_start, day_end), 2),
+                "pop": self.max_pop_between(day_start, day_end),
+            })
+            day_start = day_end
+        return daily
+
+    def as_blocks(self) -> list[tuple[int, float, float]]:
+        """All blocks as (epoch, pop, rain) tuples."""
+        return list(zip(self._timestamps, self._pop, self._rain))
+
+    def as_list(self, start: datetime | None = None, end: datetime | None = None) -> list[dict[str, Any]]:
+        """Compact OWM-shaped representation, suitable for storage and attributes.
+
+        When start and end are given only the blocks overlapping that window are returned.
+        """
+        lo, hi = (0, len(self._timestamps)) if start is None or end is None else self._overlapping(start, end)
+        return [
+            {
+                "dt": self._timestamps[i],
+                "dt_txt": dt_util.as_local(dt_util.utc_from_timestamp(self._timestamps[i])).strftime("%Y-%m-%d %H:%M:%S"),
+                "pop": self._pop[i],
+                "rain": {self._rain_key: self._rain[i]},
+            }
+            for i in range(lo, hi)
+        ]
@@ -122,5 +122,6 @@ class IrrigationFlowRate(SolemNumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         self._attr_native_value = value
         station_id = int(self.device_id.rsplit('_', 1)[-1])
-        self.coordinator.water_flow_rate[station_id - 1] = value
+        # Propagates to the targets and forecasted sprinkle of this station only
+        self.coordinator.async_set_water_flow_rate(station_id, value)
         self.async_write_ha_state()
@@ -0,0 +1,167 @@
+"""Compiled form of the irrigation schedule.
+
+The schedule is stored and edited as the JSON the Solem Schedule Card works with:
+12 months of ``{"interval_days", "hours": ["07:00", ...], "stations":
+{"station_1_minutes": 10, ...}}``. It is validated and compiled once, when it is
+set or loaded, so watering decisions never parse strings again.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+import re
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Used by the watering logic when a month has no interval set
+DEFAULT_INTERVAL_DAYS = 2
+
+_STATION_KEY = re.compile(r"^station_(\d+)_minutes$")
+
+
+class ScheduleError(ValueError):
+    """Invalid irrigation schedule."""
+
+
+def parse_hour(value: Any) -> time:
+    """Parse a watering hour, "07:00" or "07:00:00"."""
+    if isinstance(value, time):
+        return value.replace(second=0, microsecond=0)
+    for hour_format in ("%H:%M", "%H:%M:%S"):
+        try:
+            return datetime.strptime(str(value), hour_format).time().replace(second=0)
+        except ValueError:
+            continue
+    raise ScheduleError(f"Invalid hour {value!r}, expected HH:MM")
+
+
+def _non_negative_int(value: Any, name: str) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = -1
+    if number < 0 or isinstance(value, bool):
+        raise ScheduleError(f"Invalid {name} {value!r}")
+    return number
+
+
+@dataclass(frozen=True, slots=True)
+class MonthSchedule:
+    """Watering plan of one month."""
+
+    interval_days: int
+    # Sorted, without duplicates
+    hours: tuple[time, ...]
+    # Minutes per station, index 0 is station 1
+    station_minutes: tuple[int, ...]
+
+    @property
+    def waters(self) -> bool:
+        return bool(self.hours)
+
+    @classmethod
+    def compile(cls, month_config: dict[str, Any], num_stations: int) -> MonthSchedule:
+        if not isinstance(month_config, dict):
+            raise ScheduleError("Month configuration must be an object")
+
+        interval_days = _non_negative_int(month_config.get("interval_days", DEFAULT_INTERVAL_DAYS), "interval_days")
+
+        hours = tuple(sorted({parse_hour(hour) for hour in month_config.get("hours") or [] if hour}))
+
+        station_minutes = [0] * num_stations
+        for key, minutes in (month_config.get("stations") or {}).items():
+            match = _STATION_KEY.match(str(key))
+            if not match:
+                raise ScheduleError(f"Invalid station key {key!r}")
+            station = int(match.group(1))
+            minutes = _non_negative_int(minutes, f"minutes for station {station}")
+            # Keys of stations beyond the configured count are ignored
+            if 1 <= station <= num_stations:
+                station_minutes[station - 1] = minutes
+
+        return cls(interval_days, hours, tuple(station_minutes))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchedule:
+    """The 12 month schedule, validated and parsed."""
+
+    months: tuple[MonthSchedule, ...]
+
+    @classmethod
+    def compile(cls, schedule: list[dict[str, Any]], num_stations: int) -> CompiledSchedule:
+        if not isinstance(schedule, list) or len(schedule) != 12:
+            raise ScheduleError("Schedule must have 12 months")
+        months = []
+        for index, month_config in enumerate(schedule):
+            try:
+                months.append(MonthSchedule.compile(month_config, num_stations))
+            except ScheduleError as ex:
+                raise ScheduleError(f"Month {index + 1}: {ex}") from ex
+        return cls(tuple(months))
+
+    def month(self, month: int) -> MonthSchedule:
+        """Plan of a calendar month (1-12)."""
+        return self.months[month - 1]
+
+    def replace_month(self, month: int, month_schedule: MonthSchedule) -> CompiledSchedule:
+        months = list(self.months)
+        months[month - 1] = month_schedule
+        return CompiledSchedule(tuple(months))
+
+    def first_watering_day(self, day: date) -> date | None:
+        """The given day if its month waters, else the first day of the next month that does."""
+        if self.month(day.month).waters:
+            return day
+        year, month = day.year, day.month
+        for _ in range(11):
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            if self.month(month).waters:
+                return date(year, month, 1)
+        return None
+
+    def next_watering_month(self, month: int) -> MonthSchedule | None:
+        """First month with watering hours, starting at the given calendar month."""
+        for offset in range(12):
+            month_schedule = self.months[(month - 1 + offset) % 12]
+            if month_schedule.waters:
+                return month_schedule
+        return None
+
+
+class WateringCalendar:
+    """Watering times of the next days, materialized from a compiled schedule.
+
+    Every day of a watering month from ``first_day`` on is a candidate: once a
+    watering (or rain) happens the first day moves and the calendar is rebuilt.
+    Months without watering hours are skipped, so ``days`` counts watering days.
+    """
+
+    def __init__(self, schedule: CompiledSchedule, first_day: date, days: int) -> None:
+        """Initialise."""
+        self.schedule = schedule
+        self.first_day = first_day
+        self._events: list[datetime] = []
+
+        day = schedule.first_watering_day(first_day)
+        for _ in range(days):
+            if day is None:
+                break
+            self._events.extend(
+                dt_util.as_local(datetime.combine(day, hour)) for hour in schedule.month(day.month).hours
+            )
+            day = schedule.first_watering_day(day + timedelta(days=1))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def is_valid_for(self, schedule: CompiledSchedule, first_day: date) -> bool:
+        return self.schedule is schedule and self.first_day == first_day
+
+    def next_event(self, after: datetime) -> datetime | None:
+        """First watering time after the given moment, within the horizon."""
+        index = bisect_right(self._events, after)
+        return self._events[index] if index < len(self._events) else None
@@ -0,0 +1,109 @@
+"""Scheduler running the daily watering plan of a controller.
+
+The scheduler owns the plan of the current day and a single pending timer, armed
+for the next event only: the next watering time of the plan or, after the last
+one, midnight (when the indicators are reset and the next day is planned).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .coordinator import SolemCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DayPlan:
+    """Watering times decided for one day."""
+
+    day: date
+    watering_times: tuple[datetime, ...] = ()
+
+    def next_watering(self, after: datetime) -> datetime | None:
+        return next((when for when in self.watering_times if when > after), None)
+
+
+class WateringScheduler:
+    """Runs the day plan of a coordinator with a single timer."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: SolemCoordinator) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.plan: DayPlan | None = None
+        self.next_event: datetime | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._lock = asyncio.Lock()
+        self._stopped = False
+
+    async def async_rearm(self, refresh_weather: bool = True) -> None:
+        """Plan today again and replace the pending timer.
+
+        Called on start and whenever the schedule or the configuration changes.
+        """
+        async with self._lock:
+            self._cancel_timer()
+            if self._stopped:
+                return
+            self.plan = await self.coordinator.plan_watering_day(refresh_weather)
+            self._arm_next()
+
+    def async_cancel(self) -> None:
+        """Cancel the pending timer for good (config entry unload)."""
+        self._stopped = True
+        self._cancel_timer()
+
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self.next_event = None
+
+    def _arm_next(self) -> None:
+        now = dt_util.now()
+        midnight = dt_util.start_of_local_day(now + timedelta(days=1))
+        next_watering = self.plan.next_watering(now) if self.plan else None
+        self.next_event = min(filter(None, [next_watering, midnight]))
+        self._unsub_timer = async_track_point_in_time(self.hass, self._async_handle_timer, self.next_event)
+        _LOGGER.debug(f"{self.coordinator.controller_mac_address} - Next scheduler event at {self.next_event}.")
+
+    async def _async_handle_timer(self, now: datetime) -> None:
+        self._unsub_timer = None
+        if self._stopped:
+            return
+
+        if self.plan is None or dt_util.as_local(now).date() != self.plan.day:
+            # Midnight: reset the daily indicators, plan the new day and publish it
+            try:
+                await self.coordinator.reset_rain_sprinkle_indicators()
+                await self.async_rearm()
+                await self.coordinator.async_refresh()
+            except Exception:
+                _LOGGER.exception(f"{self.coordinator.controller_mac_address} - Failed to start the watering day.")
+            finally:
+                # Whatever failed, the scheduler keeps a pending timer
+                await self._async_ensure_armed()
+            return
+
+        # Arm the next event first, a watering cycle lasts as long as the watering
+        await self._async_ensure_armed()
+        try:
+            await self.coordinator.run_watering_cycle()
+        except Exception:
+            _LOGGER.exception(f"{self.coordinator.controller_mac_address} - Scheduled watering cycle failed.")
+
+    async def _async_ensure_armed(self) -> None:
+        async with self._lock:
+            if self._unsub_timer is None and not self._stopped:
+                self._arm_next()
@@ -61,6 +61,7 @@ async def async_setup_entry(
         SensorTypeClass("TOTAL_FORECASTED_RAIN_TODAY", "state", TotalForecastedRainSensor),
         SensorTypeClass("SPRINKLE_TOTAL_AMOUNT_SENSOR", "state", SprinkleTotalAmountSensor),
         SensorTypeClass("FORECASTED_SPRINKLE_TODAY_SENSOR", "state", ForecastedSprinkleTodaySensor),
+        SensorTypeClass("WEATHER_API_CALLS_SENSOR", "state", WeatherApiCallsSensor),
     ]
 
     sensors = []
@@ -78,6 +79,9 @@ async def async_setup_entry(
 
 
 class StateSensor(SolemBaseEntity, SensorEntity):
+    # The 12 month schedule is kept out of the recorder; it is still read live by the Schedule Card
+    _unrecorded_attributes = frozenset({"schedule"})
+
     @property
     def native_value(self) -> int | float | str:
         return self.coordinator.get_device_parameter(self.device_id, self.parameter)
@@ -226,3 +230,24 @@ class ForecastedSprinkleTodaySensor(SolemBaseEntity, SensorEntity):
     def native_value(self) -> float:
         """Retorna o valor previsto de rega para hoje para esta estação (mm)."""
         return self.coordinator.get_device_parameter(self.device_id, self.parameter)
+
+
+class WeatherApiCallsSensor(SolemBaseEntity, SensorEntity):
+    """Number of OpenWeatherMap requests made today with this API key."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "requests"
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.get_device_parameter(self.device_id, self.parameter)
+
+    @property
+    def extra_state_attributes(self):
+        attrs = {}
+        weather_api = self.coordinator.weather_api
+        if weather_api and weather_api.budget:
+            attrs["daily_budget"] = weather_api.budget.daily_limit
+            attrs["remaining"] = weather_api.budget.remaining
+            attrs["refresh_interval_minutes"] = round(weather_api.get_refresh_interval().total_seconds() / 60, 1)
+        return attrs
@@ -0,0 +1,198 @@
+"""Domain-wide services of the integration.
+
+Services target controllers through their devices or entities. Targets are
+resolved to config entries and then to coordinators through hass.data, and a
+call fans out to every targeted controller concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import SolemCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_SCHEDULE = "set_irrigation_schedule"
+SERVICE_PATCH_SCHEDULE = "patch_irrigation_schedule"
+SERVICE_START_STATION = "start_station"
+SERVICE_STOP_IRRIGATION = "stop_irrigation"
+SERVICE_RUN_SEQUENCE = "run_sequence"
+SERVICE_GET_SCHEDULE = "get_schedule"
+SERVICE_GET_FORECAST_TIMELINE = "get_forecast_timeline"
+SERVICE_GET_STATUS = "get_status"
+SERVICE_PROPOSE_SCHEDULE = "propose_schedule"
+
+
+def _schedule_hour(value: Any) -> str:
+    """Validate a watering hour ("07:00" or "07:00:00") and store it as HH:MM."""
+    return cv.time(value).strftime("%H:%M")
+
+
+STATION_RUN_SCHEMA = {
+    vol.Required("station"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional("minutes"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+}
+
+SET_SCHEDULE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required("schedule"): vol.All(cv.ensure_list, vol.Length(min=12, max=12), [dict])}
+)
+
+PATCH_SCHEDULE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("month"): vol.All(vol.Coerce(int), vol.Range(min=1, max=12)),
+        vol.Optional("interval_days"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("hours"): vol.All(cv.ensure_list, [_schedule_hour]),
+        vol.Optional("stations"): {vol.Coerce(int): vol.All(vol.Coerce(int), vol.Range(min=0))},
+    }
+)
+
+START_STATION_SCHEMA = cv.make_entity_service_schema(STATION_RUN_SCHEMA)
+
+RUN_SEQUENCE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required("sequence"): vol.All(cv.ensure_list, vol.Length(min=1), [vol.Schema(STATION_RUN_SCHEMA)])}
+)
+
+TARGET_SCHEMA = cv.make_entity_service_schema({})
+
+PROPOSE_SCHEDULE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("month"): vol.All(vol.Coerce(int), vol.Range(min=1, max=12)),
+        vol.Required("weekly_mm"): vol.All(cv.ensure_list, vol.Length(min=1), [vol.All(vol.Coerce(float), vol.Range(min=0))]),
+        vol.Optional("daily_rain"): vol.All(cv.ensure_list, vol.Length(min=7), [vol.All(vol.Coerce(float), vol.Range(min=0))]),
+        vol.Optional("days", default=91): vol.All(vol.Coerce(int), vol.Range(min=7, max=366)),
+        vol.Optional("rain_probability", default=0.25): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+        vol.Optional("mean_rain_mm", default=5.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("seed"): vol.Coerce(int),
+    }
+)
+
+
+async def _async_get_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[SolemCoordinator]:
+    """Coordinators of the controllers targeted by a service call."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_ids = await async_extract_config_entry_ids(hass, call)
+    targeted = [coordinators[entry_id] for entry_id in entry_ids if entry_id in coordinators]
+    if not targeted:
+        raise HomeAssistantError("No Solem controller targeted, select a device or entity of this integration")
+    return targeted
+
+
+def _check_station(coordinator: SolemCoordinator, station: int) -> None:
+    if station > coordinator.num_stations:
+        raise HomeAssistantError(
+            f"Invalid station {station}, {coordinator.controller_mac_address} has {coordinator.num_stations}"
+        )
+
+
+async def _async_run_sequence(coordinator: SolemCoordinator, sequence: list[dict[str, Any]]) -> None:
+    """Water the stations one after another, until the sequence ends or watering is stopped."""
+    for step in sequence:
+        await coordinator.start_irrigation(step["station"], step.get("minutes"))
+        if coordinator.irrigation_stop_event.is_set():
+            _LOGGER.info(f"{coordinator.controller_mac_address} - Sequence stopped.")
+            return
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the domain services, once for every controller."""
+
+    async def fan_out(call: ServiceCall, action) -> list[Any]:
+        coordinators = await _async_get_coordinators(hass, call)
+        return await asyncio.gather(*(action(coordinator) for coordinator in coordinators))
+
+    async def handle_set_schedule(call: ServiceCall) -> None:
+        await fan_out(call, lambda coordinator: coordinator.async_set_schedule(call.data["schedule"]))
+
+    async def handle_patch_schedule(call: ServiceCall) -> None:
+        await fan_out(
+            call,
+            lambda coordinator: coordinator.async_patch_schedule(
+                call.data["month"],
+                interval_days=call.data.get("interval_days"),
+                hours=call.data.get("hours"),
+                stations=call.data.get("stations"),
+            ),
+        )
+
+    async def handle_start_station(call: ServiceCall) -> None:
+        coordinators = await _async_get_coordinators(hass, call)
+        for coordinator in coordinators:
+            _check_station(coordinator, call.data["station"])
+        # Watering lasts minutes, so it runs in the background like the sprinkle buttons
+        for coordinator in coordinators:
+            hass.async_create_task(coordinator.start_irrigation(call.data["station"], call.data.get("minutes")))
+
+    async def handle_stop_irrigation(call: ServiceCall) -> None:
+        await fan_out(call, lambda coordinator: coordinator.stop_irrigation())
+
+    async def handle_run_sequence(call: ServiceCall) -> None:
+        coordinators = await _async_get_coordinators(hass, call)
+        for coordinator in coordinators:
+            for step in call.data["sequence"]:
+                _check_station(coordinator, step["station"])
+        for coordinator in coordinators:
+            hass.async_create_task(_async_run_sequence(coordinator, call.data["sequence"]))
+
+    async def respond(call: ServiceCall, action) -> ServiceResponse:
+        """Responses are keyed by controller MAC address."""
+        coordinators = await _async_get_coordinators(hass, call)
+
+        async def read(coordinator: SolemCoordinator):
+            result = action(coordinator)
+            return await result if asyncio.iscoroutine(result) else result
+
+        results = await asyncio.gather(*(read(coordinator) for coordinator in coordinators))
+        return {
+            coordinator.controller_mac_address: result
+            for coordinator, result in zip(coordinators, results)
+        }
+
+    async def handle_get_schedule(call: ServiceCall) -> ServiceResponse:
+        return await respond(call, lambda coordinator: coordinator.get_schedule_response())
+
+    async def handle_get_forecast_timeline(call: ServiceCall) -> ServiceResponse:
+        return await respond(call, lambda coordinator: coordinator.get_forecast_timeline_response())
+
+    async def handle_get_status(call: ServiceCall) -> ServiceResponse:
+        return await respond(call, lambda coordinator: coordinator.get_status_response())
+
+    async def handle_propose_schedule(call: ServiceCall) -> ServiceResponse:
+        return await respond(
+            call,
+            lambda coordinator: coordinator.async_propose_schedule(
+                call.data.get("month", dt_util.now().month),
+                call.data["weekly_mm"],
+                daily_rain=call.data.get("daily_rain"),
+                days=call.data["days"],
+                rain_probability=call.data["rain_probability"],
+                mean_rain_mm=call.data["mean_rain_mm"],
+                seed=call.data.get("seed"),
+            ),
+        )
+
+    services = {
+        SERVICE_SET_SCHEDULE: (handle_set_schedule, SET_SCHEDULE_SCHEMA, SupportsResponse.NONE),
+        SERVICE_PATCH_SCHEDULE: (handle_patch_schedule, PATCH_SCHEDULE_SCHEMA, SupportsResponse.NONE),
+        SERVICE_START_STATION: (handle_start_station, START_STATION_SCHEMA, SupportsResponse.NONE),
+        SERVICE_STOP_IRRIGATION: (handle_stop_irrigation, TARGET_SCHEMA, SupportsResponse.NONE),
+        SERVICE_RUN_SEQUENCE: (handle_run_sequence, RUN_SEQUENCE_SCHEMA, SupportsResponse.NONE),
+        SERVICE_GET_SCHEDULE: (handle_get_schedule, TARGET_SCHEMA, SupportsResponse.ONLY),
+        SERVICE_GET_FORECAST_TIMELINE: (handle_get_forecast_timeline, TARGET_SCHEMA, SupportsResponse.ONLY),
+        SERVICE_GET_STATUS: (handle_get_status, TARGET_SCHEMA, SupportsResponse.ONLY),
+        SERVICE_PROPOSE_SCHEDULE: (handle_propose_schedule, PROPOSE_SCHEDULE_SCHEMA, SupportsResponse.ONLY),
+    }
+
+    for service, (handler, schema, supports_response) in services.items():
+        hass.services.async_register(DOMAIN, service, handler, schema=schema, supports_response=supports_response)
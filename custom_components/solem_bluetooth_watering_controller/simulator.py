@@ -0,0 +1,175 @@
+"""Season simulation of the watering logic and schedule optimizer.
+
+The simulation applies the coordinator rules day by day: a day waters when the
+month interval has passed since the last rain or sprinkle, each station gets
+its target (minutes x watering hours x mm/min) minus the rain of the day, in
+whole minutes, and every station watered is one Bluetooth session.
+
+Which days water only depends on the interval and the rain, so the stations
+and their minutes are independent once the interval and the number of
+watering hours are chosen. Every candidate of a given interval is evaluated at
+once, with NumPy arrays over (watering hours, minutes, stations, days).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_INTERVALS = tuple(range(1, 8))
+DEFAULT_OCCURRENCES = (1, 2, 3)
+DEFAULT_MINUTES = tuple(range(0, 61, 5))
+
+
+def synthetic_rain(days: int, rain_probability: float, mean_rain_mm: float, seed: int | None = None) -> np.ndarray:
+    """Daily rain (mm): a day rains with the given probability, an exponential amount."""
+    rng = np.random.default_rng(seed)
+    wet = rng.random(days) < rain_probability
+    return np.where(wet, rng.exponential(mean_rain_mm, days), 0.0)
+
+
+def watering_days(rain: np.ndarray, interval_days: Sequence[int]) -> np.ndarray:
+    """Days watered for each interval, a (intervals, days) mask.
+
+    The season starts with the interval passed. A rain day is an event even if
+    it covers the targets; a watering day is one as some station sprinkles.
+    """
+    intervals = np.asarray(interval_days)
+    last_event = np.full(intervals.shape, -np.inf)
+    mask = np.zeros((intervals.size, rain.size), dtype=bool)
+    for day, day_rain in enumerate(rain):
+        # Decided at midnight, before the rain of the day is known
+        due = day - last_event >= intervals
+        mask[:, day] = due
+        last_event = np.where(due | (day_rain > 0), day, last_event)
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonResult:
+    """Totals of a simulated season, per station."""
+
+    sessions: np.ndarray
+    water_mm: np.ndarray
+    deficit_mm: np.ndarray
+
+
+def simulate(
+    rain: np.ndarray,
+    mask: np.ndarray,
+    occurrences: np.ndarray,
+    minutes: np.ndarray,
+    mm_per_minute: np.ndarray,
+    weekly_mm: np.ndarray,
+) -> SeasonResult:
+    """Simulate the season of one interval (its days mask) for every candidate.
+
+    Every station needs a positive mm_per_minute. Results are shaped
+    (occurrences, minutes, stations); the deficit is the
+    water missing to reach weekly_mm (rain included), summed over the weeks,
+    a partial last week needing weekly_mm prorated to its days.
+    """
+    target = mm_per_minute * minutes[:, None] * occurrences[:, None, None]
+    remaining = np.maximum(0.0, target[..., None] - rain)
+    remaining = np.where(mask, remaining, 0.0)
+    # Whole minutes, rounded up as the watering cycle does
+    applied = np.floor(remaining / mm_per_minute[:, None] + 0.999) * mm_per_minute[:, None]
+
+    weeks = -(-rain.size // 7)
+    padding = weeks * 7 - rain.size
+    received = np.pad(applied + rain, [(0, 0)] * 3 + [(0, padding)])
+    weekly = received.reshape(*received.shape[:-1], weeks, 7).sum(axis=-1)
+    # A partial last week only needs its share of weekly_mm
+    week_days = np.full(weeks, 7)
+    week_days[-1] -= padding
+    need = weekly_mm[:, None] * week_days / 7
+    deficit = np.maximum(0.0, need - weekly).sum(axis=-1)
+
+    return SeasonResult(
+        sessions=(remaining > 0).sum(axis=-1),
+        water_mm=applied.sum(axis=-1),
+        deficit_mm=deficit,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleProposal:
+    """Best schedule found for a month and its simulated season."""
+
+    interval_days: int
+    occurrences: int
+    station_minutes: tuple[int, ...]
+    sessions: int
+    water_mm: float
+    deficit_mm: float
+    watering_days: int
+
+
+def optimize_schedule(
+    rain: Sequence[float],
+    mm_per_minute: Sequence[float],
+    weekly_mm: Sequence[float],
+    tolerance: float = 0.1,
+    intervals: Sequence[int] = DEFAULT_INTERVALS,
+    occurrences: Sequence[int] = DEFAULT_OCCURRENCES,
+    minutes: Sequence[int] = DEFAULT_MINUTES,
+) -> ScheduleProposal:
+    """Search the interval, watering hours and station minutes over a season.
+
+    Schedules missing at most tolerance of the water needed are preferred, then
+    the fewest Bluetooth sessions, then the least water. Without such a schedule
+    for a station, its smallest deficit wins. Stations without flow cannot be
+    watered; they are left out and get 0 minutes.
+    """
+    rain = np.asarray(rain, dtype=float)
+    all_mm_per_minute = np.asarray(mm_per_minute, dtype=float)
+    watered = np.flatnonzero(all_mm_per_minute > 0)
+    mm_per_minute = all_mm_per_minute[watered]
+    weekly_mm = np.asarray(weekly_mm, dtype=float)[watered]
+    occurrences_grid = np.asarray(occurrences)
+    minutes_grid = np.asarray(minutes)
+    allowed_deficit = tolerance * weekly_mm * rain.size / 7
+
+    masks = watering_days(rain, intervals)
+    best = None
+    for interval, mask in zip(intervals, masks):
+        result = simulate(rain, mask, occurrences_grid, minutes_grid, mm_per_minute, weekly_mm)
+        missing = np.where(result.deficit_mm <= allowed_deficit, 0.0, result.deficit_mm)
+
+        for occurrence_index, occurrence in enumerate(occurrences_grid):
+            choice = [
+                np.lexsort(
+                    (
+                        result.water_mm[occurrence_index, :, station],
+                        result.sessions[occurrence_index, :, station],
+                        missing[occurrence_index, :, station],
+                    )
+                )[0]
+                for station in range(mm_per_minute.size)
+            ]
+            stations = np.arange(mm_per_minute.size)
+            picked = (occurrence_index, choice, stations)
+            key = (
+                float(missing[picked].sum()),
+                int(result.sessions[picked].sum()),
+                float(result.water_mm[picked].sum()),
+            )
+            if best is None or key < best[0]:
+                station_minutes = [0] * all_mm_per_minute.size
+                for station, index in zip(watered, choice):
+                    station_minutes[station] = int(minutes_grid[index])
+                best = (
+                    key,
+                    ScheduleProposal(
+                        interval_days=int(interval),
+                        occurrences=int(occurrence),
+                        station_minutes=tuple(station_minutes),
+                        sessions=key[1],
+                        water_mm=round(key[2], 1),
+                        deficit_mm=round(float(result.deficit_mm[picked].sum()), 1),
+                        watering_days=int(mask.sum()),
+                    ),
+                )
+    return best[1]
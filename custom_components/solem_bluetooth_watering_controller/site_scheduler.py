@@ -0,0 +1,147 @@
+"""Site wide admission control for the controllers sharing a supply line.
+
+Controllers plan their days independently, so several of them may want to open
+a valve at the same time. Every run requests a lease first; a lease is granted
+while the total flow (L/min) and the number of open valves stay within the site
+limits, otherwise the run waits. Waiting runs are admitted longest first, each
+one that fits (first fit), which keeps as many valves open as the limits allow.
+This is admission control at the moment runs start, not a plan of the watering
+window: a run overtaken by later ones SITE_LEASE_MAX_BYPASS times goes first,
+and nothing is admitted ahead of it, so short runs are not starved.
+
+The scheduler lives in hass.data[DOMAIN], shared by the config entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SITE_LEASE_MAX_BYPASS, SITE_SCHEDULER
+
+
+class SiteLease:
+    """Permission for one run to open its valve."""
+
+    def __init__(
+        self, site: SiteFlowScheduler, entry_id: str, owner: str, flow_rate: float, minutes: float
+    ) -> None:
+        """Initialise."""
+        self.site = site
+        self.entry_id = entry_id
+        self.owner = owner
+        self.flow_rate = flow_rate
+        self.minutes = minutes
+        # Times later runs were admitted while this one waited
+        self.bypassed = 0
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    @property
+    def granted(self) -> bool:
+        return self.future.done() and not self.future.cancelled()
+
+    def release(self) -> None:
+        """Give the flow back (or stop waiting for it)."""
+        self.site._release(self)
+
+
+class SiteFlowScheduler:
+    """Admits valve openings within the flow limits of the site."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        # Limits set by each controller, 0 means unlimited
+        self._limits: dict[str, tuple[float, int]] = {}
+        self._active: list[SiteLease] = []
+        self._waiting: list[SiteLease] = []
+
+    def register(self, entry_id: str, max_flow: float, max_valves: int) -> None:
+        self._limits[entry_id] = (max_flow, max_valves)
+        self._dispatch()
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove the limits of a controller and cancel its waiting runs."""
+        self._limits.pop(entry_id, None)
+        for lease in [lease for lease in self._waiting if lease.entry_id == entry_id]:
+            self._waiting.remove(lease)
+            lease.future.cancel()
+        self._dispatch()
+
+    @property
+    def max_flow(self) -> float | None:
+        """Most restrictive flow limit (L/min) set by a controller."""
+        return min((limit for limit, _ in self._limits.values() if limit), default=None)
+
+    @property
+    def max_valves(self) -> int | None:
+        """Most restrictive number of valves open at once set by a controller."""
+        return min((limit for _, limit in self._limits.values() if limit), default=None)
+
+    def request(self, entry_id: str, owner: str, flow_rate: float, minutes: float) -> SiteLease:
+        """Request a lease, granted right away when it fits (see SiteLease.future)."""
+        lease = SiteLease(self, entry_id, owner, flow_rate, minutes)
+        self._waiting.append(lease)
+        self._dispatch()
+        return lease
+
+    def _fits(self, lease: SiteLease) -> bool:
+        if not self._active:
+            # A run over the limits on its own still runs, alone
+            return True
+        if self.max_valves and len(self._active) >= self.max_valves:
+            return False
+        if self.max_flow and sum(active.flow_rate for active in self._active) + lease.flow_rate > self.max_flow:
+            return False
+        return True
+
+    def _grant(self, lease: SiteLease) -> None:
+        self._waiting.remove(lease)
+        self._active.append(lease)
+        lease.future.set_result(None)
+
+    def _dispatch(self) -> None:
+        """Admit the waiting runs that fit now."""
+        while self._waiting:
+            # Aging: the first run overtaken too often goes next, nothing else is admitted before it
+            starved = next((lease for lease in self._waiting if lease.bypassed >= SITE_LEASE_MAX_BYPASS), None)
+            if starved is None:
+                break
+            if not self._fits(starved):
+                return
+            self._grant(starved)
+
+        admitted = False
+        for lease in sorted(self._waiting, key=lambda lease: lease.minutes, reverse=True):
+            if self._fits(lease):
+                self._grant(lease)
+                admitted = True
+        if admitted:
+            for lease in self._waiting:
+                lease.bypassed += 1
+
+    def _release(self, lease: SiteLease) -> None:
+        if lease in self._waiting:
+            self._waiting.remove(lease)
+            lease.future.cancel()
+        if lease in self._active:
+            self._active.remove(lease)
+        self._dispatch()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "max_flow": self.max_flow,
+            "max_valves": self.max_valves,
+            "flow": sum(lease.flow_rate for lease in self._active),
+            "active": [lease.owner for lease in self._active],
+            "waiting": [lease.owner for lease in self._waiting],
+        }
+
+
+def get_site_scheduler(hass: HomeAssistant) -> SiteFlowScheduler:
+    """Return the scheduler shared by every controller."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if SITE_SCHEDULER not in domain_data:
+        domain_data[SITE_SCHEDULER] = SiteFlowScheduler()
+    return domain_data[SITE_SCHEDULER]
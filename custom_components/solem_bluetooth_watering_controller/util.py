@@ -1,4 +1,5 @@
 import random
+import time
 import uuid
 from datetime import datetime
 from homeassistant.util import dt as dt_util
@@ -29,4 +30,57 @@ def ensure_aware(dt_obj: datetime | None) -> datetime | None:
     """Ensure datetime is timezone-aware."""
     if dt_obj and dt_obj.tzinfo is None:
         return dt_util.as_local(dt_obj)
-    return dt_obj
\ No newline at end of file
+    return dt_obj
+
+
+class RateIntegrator:
+    """Integrates a rate (per hour) over monotonic time.
+
+    Observations carry the timestamp they were made at, so the same observation
+    served again from a cache does not restart or extend it, and an observation
+    stops counting once it is older than max_age.
+    """
+
+    def __init__(self, max_age: float | None = None) -> None:
+        self.max_age = max_age
+        self.rate = 0.0
+        self._observed_at: float | None = None
+        self._valid_until: float | None = None
+        self._since: float | None = None
+
+    def observe(self, rate: float, observed_at: float | None = None) -> float:
+        """Account the current rate up to now, then switch to a new observation.
+
+        Returns the amount accrued since the previous call.
+        """
+        amount = self.advance()
+        if observed_at is None or observed_at != self._observed_at:
+            self.rate = rate
+            self._observed_at = observed_at
+            self._valid_until = None
+            if self.max_age is not None and observed_at is not None:
+                # Observation timestamps are wall clock, convert the expiry to monotonic time
+                self._valid_until = time.monotonic() + observed_at + self.max_age - time.time()
+        return amount
+
+    def advance(self) -> float:
+        """Amount accrued at the current rate since the previous call."""
+        now = time.monotonic()
+        since, self._since = self._since, now
+        if since is None or not self.rate:
+            return 0.0
+        end = now if self._valid_until is None else min(now, self._valid_until)
+        return self.rate * max(0.0, end - since) / 3600
+
+
+class ElapsedTimer:
+    """Monotonic time elapsed between successive calls."""
+
+    def __init__(self) -> None:
+        self._last = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since the previous call (or creation)."""
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        return elapsed
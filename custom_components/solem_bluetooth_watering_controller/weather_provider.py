@@ -0,0 +1,772 @@
+"""Weather providers used by the coordinator.
+
+WeatherProvider is the interface the watering logic queries. OpenWeatherMapAPI
+calls the OpenWeatherMap API within a daily request budget shared per API key.
+HomeAssistantWeatherProvider reads forecasts with the weather.get_forecasts
+service and current conditions from the entity state, so no HTTP request or API
+quota of our own is involved. HedgedWeatherProvider combines several providers.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from operator import methodcaller
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .api import APIConnectionError
+from .const import (
+    OPEN_WEATHER_MAP_CURRENT_URL,
+    OPEN_WEATHER_MAP_FORECAST_URL,
+    WEATHER_BACKOFF_BASE_SECONDS,
+    WEATHER_BACKOFF_MAX_SECONDS,
+    WEATHER_DECISION_LEAD_MINUTES,
+    WEATHER_IDLE_REFRESH_MINUTES,
+    WEATHER_REQUEST_TIMEOUT_SECONDS,
+)
+from .forecast import FORECAST_DAYS, CurrentWeather, ForecastTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+# Weather conditions (HA weather entity states) that mean it is raining now
+RAINY_CONDITIONS = {"rainy", "pouring", "lightning-rainy", "snowy-rainy", "hail"}
+
+# Forecast types to try, finest first, with the length of each block
+FORECAST_TYPES = (
+    ("hourly", 60 * 60),
+    ("twice_daily", 12 * 60 * 60),
+    ("daily", 24 * 60 * 60),
+)
+
+
+class WeatherProvider(ABC):
+    """Base class for the weather sources used by the coordinator.
+
+    Providers implement get_current_weather and get_forecast; the rain queries
+    the watering logic relies on are answered from those here.
+    """
+
+    # Request budget, for providers with a call quota
+    budget = None
+
+    @abstractmethod
+    async def get_current_weather(self) -> CurrentWeather:
+        """Current conditions."""
+
+    @abstractmethod
+    async def get_forecast(self) -> ForecastTimeline:
+        """Forecast timeline covering at least the rest of today."""
+
+    def set_decision_times(self, decision_times: list[datetime], active: bool = False) -> None:
+        """Set the upcoming moments at which watering decisions use weather data."""
+
+    async def refresh_for_decision(self) -> None:
+        """Bring data up to date right before a watering decision."""
+
+    def get_refresh_interval(self) -> timedelta:
+        """Maximum age of cached data."""
+        return timedelta(0)
+
+    def get_cache_status(self) -> dict:
+        """Staleness metadata for the cached weather data."""
+        return {}
+
+    def cached_forecast(self) -> ForecastTimeline | None:
+        """Forecast held in memory, without any request; None when nothing is cached."""
+        return None
+
+    def export_cache(self) -> dict:
+        """Serializable snapshot of the cached weather, for persistent storage."""
+        return {}
+
+    def restore_cache(self, cache: dict) -> bool:
+        """Restore a snapshot made by export_cache."""
+        return False
+
+    def async_cancel(self) -> None:
+        """Cancel the requests still running, when the provider is discarded."""
+
+    async def is_raining(self) -> dict:
+        current_weather = await self.get_current_weather()
+        
+        return {
+            "is_raining": current_weather.is_raining,
+            "current": current_weather.as_dict(include_raw=True)
+        }
+
+    async def will_it_rain(self) -> dict:
+        """Verifies if it will rain for the rest of the day."""
+        forecast = await self.get_forecast()
+    
+        now = dt_util.now()
+        end_of_day = dt_util.start_of_local_day(now + timedelta(days=1))
+    
+        will_rain = forecast.max_pop_between(now, end_of_day) > 0.50
+    
+        return {
+            "will_rain": will_rain,
+            "forecast": forecast.as_list(now, end_of_day)
+        }
+
+    async def get_rain_forecast_by_day(self) -> list[dict]:
+        """Forecasted rain (mm) and highest pop for each day covered by the forecast."""
+        forecast = await self.get_forecast()
+        return forecast.rain_by_day(dt_util.now(), FORECAST_DAYS)
+
+    async def get_total_rain_forecast_for_today(self) -> float:
+        """Calculates total amount of rain predicted (mm) for the rest of the day."""
+        forecast = await self.get_forecast()
+    
+        now = dt_util.now()
+        end_of_day = dt_util.start_of_local_day(now + timedelta(days=1))
+    
+        # Blocks already started are prorated to the time remaining in them
+        return forecast.rain_between(now, end_of_day)
+
+
+class OpenWeatherMapRequestBudget:
+    """Daily request counter shared by every OpenWeatherMapAPI using the same key."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.calls_today = 0
+        self.day = dt_util.now().date()
+        # Daily limit set by each controller using the key
+        self._limits: dict[str, int] = {}
+
+    def _roll_day(self) -> None:
+        today = dt_util.now().date()
+        if today != self.day:
+            self.day = today
+            self.calls_today = 0
+
+    def register(self, owner: str, daily_limit: int) -> None:
+        self._limits[owner] = daily_limit
+
+    def unregister(self, owner: str) -> None:
+        self._limits.pop(owner, None)
+
+    @property
+    def daily_limit(self) -> int:
+        """Most restrictive daily limit set by a controller."""
+        return min(self._limits.values(), default=0)
+
+    def record_call(self) -> None:
+        self._roll_day()
+        self.calls_today += 1
+
+    @property
+    def remaining(self) -> int:
+        self._roll_day()
+        return max(0, self.daily_limit - self.calls_today)
+
+    def min_refresh_interval(self) -> timedelta:
+        """Spacing between refreshes of one request kind that keeps the key within budget."""
+        now = dt_util.now()
+        seconds_left = (dt_util.start_of_local_day(now + timedelta(days=1)) - now).total_seconds()
+        # Every controller refreshes both current weather and forecast
+        consumers = 2 * max(1, len(self._limits))
+        return timedelta(seconds=seconds_left * consumers / max(1, self.remaining))
+
+
+_request_budgets: dict[str, OpenWeatherMapRequestBudget] = {}
+
+
+def get_request_budget(api_key: str) -> OpenWeatherMapRequestBudget:
+    """Return the budget shared by every controller using api_key."""
+    budget = _request_budgets.get(api_key)
+    if budget is None:
+        budget = _request_budgets[api_key] = OpenWeatherMapRequestBudget()
+    return budget
+
+
+class OpenWeatherMapAPI(WeatherProvider):
+    """Class for OpenWeatherMap API.
+
+    Expired data keeps being served while a refresh runs in the background, and
+    failed requests back off exponentially so a provider outage never blocks the
+    coordinator update.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        owner: str,
+        api_key: str,
+        latitude: str,
+        longitude: str,
+        timeout: int,
+        daily_budget: int,
+        keep_raw: bool = False,
+    ) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.api_key = api_key
+        self.latitude = latitude
+        self.longitude = longitude
+        self.timeout = timeout
+        self.owner = owner
+        self.budget = get_request_budget(api_key)
+        self.budget.register(owner, daily_budget)
+        # Upcoming watering decisions drive when data is refreshed
+        self._decision_times: list[datetime] = []
+        self._watering_active = False
+        # Forecast blocks are parsed once on ingest and indexed by timestamp
+        self._cache_forecast = ForecastTimeline()
+        # Current weather is projected to a compact record; the raw payload is only kept when debugging
+        self.keep_raw = keep_raw
+        self._cache_current: CurrentWeather | None = None
+        self._last_forecast_fetch_time = None
+        self.last_forecast_date = dt_util.now().date()
+        self._last_current_fetch_time = None
+        # Backoff state per request kind ("current" / "forecast")
+        self._consecutive_failures = {"current": 0, "forecast": 0}
+        self._retry_after = {"current": None, "forecast": None}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        # HTTP validators (ETag / Last-Modified) of the last response per request kind
+        self._validators = {"current": {}, "forecast": {}}
+        
+
+    def set_decision_times(self, decision_times: list[datetime], active: bool = False) -> None:
+        """Set the upcoming moments at which watering decisions use weather data.
+
+        While watering is active every poll is a decision (stop on rain).
+        """
+        self._decision_times = sorted(decision_times)
+        self._watering_active = active
+
+    def _decision_imminent(self) -> bool:
+        now = dt_util.now()
+        window = timedelta(minutes=WEATHER_DECISION_LEAD_MINUTES)
+        return any(now <= decision_time <= now + window for decision_time in self._decision_times)
+
+    def get_refresh_interval(self) -> timedelta:
+        """Maximum age of cached data under the schedule-driven refresh policy.
+
+        Close to a decision point (or while watering) the configured timeout applies;
+        otherwise data is refreshed rarely, and never faster than the daily budget allows.
+        """
+        interval = timedelta(minutes=self.timeout)
+        if self._watering_active or self._decision_imminent():
+            return interval
+        idle_interval = max(interval, timedelta(minutes=WEATHER_IDLE_REFRESH_MINUTES))
+        return max(idle_interval, self.budget.min_refresh_interval())
+
+    def _is_fresh(self, fetch_time: datetime | None) -> bool:
+        return fetch_time is not None and dt_util.now() - fetch_time < self.get_refresh_interval()
+
+    async def _refresh(self, kind: str, fetch) -> None:
+        """Run a fetch, tracking consecutive failures for the backoff."""
+        try:
+            await fetch()
+        except APIConnectionError:
+            failures = self._consecutive_failures[kind] = self._consecutive_failures[kind] + 1
+            backoff = min(WEATHER_BACKOFF_MAX_SECONDS, WEATHER_BACKOFF_BASE_SECONDS * 2 ** (failures - 1))
+            self._retry_after[kind] = dt_util.now() + timedelta(seconds=backoff)
+            _LOGGER.warning(f"OpenWeatherMap {kind} request failed {failures} time(s), retrying in {backoff}s.")
+            raise
+        self._consecutive_failures[kind] = 0
+        self._retry_after[kind] = None
+
+    async def _background_refresh(self, kind: str, fetch) -> None:
+        try:
+            await self._refresh(kind, fetch)
+        except APIConnectionError:
+            pass  # Already logged, stale data keeps being served
+        finally:
+            self._refresh_tasks.pop(kind, None)
+
+    def _start_background_refresh(self, kind: str, fetch) -> None:
+        """Refresh kind in a task owned by HA, cancelled by async_cancel."""
+        self._refresh_tasks[kind] = self.hass.async_create_background_task(
+            self._background_refresh(kind, fetch), f"OpenWeatherMap {kind} refresh"
+        )
+
+    def async_cancel(self) -> None:
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+        self.budget.unregister(self.owner)
+
+    async def _get_cached(self, kind: str, cached: Any, fetch_time: datetime | None, fetch) -> None:
+        """Ensure data for kind is available, revalidating stale data in the background."""
+        if cached and self._is_fresh(fetch_time):
+            _LOGGER.debug("Returning cached data.")
+            return
+
+        retry_after = self._retry_after[kind]
+        if retry_after and dt_util.now() < retry_after:
+            # Negative cache: the last request failed recently, do not hit the network
+            if not cached:
+                raise APIConnectionError(f"OpenWeatherMap {kind} data unavailable until {retry_after}")
+            _LOGGER.debug(f"Backing off {kind} refresh until {retry_after}, returning stale data.")
+            return
+
+        if not self.budget.remaining:
+            if not cached:
+                raise APIConnectionError(f"OpenWeatherMap daily budget of {self.budget.daily_limit} requests exhausted")
+            _LOGGER.debug(f"Daily request budget exhausted, returning stale {kind} data.")
+            return
+
+        if not cached:
+            await self._refresh(kind, fetch)
+            return
+
+        if kind not in self._refresh_tasks:
+            _LOGGER.debug(f"Returning stale {kind} data, refreshing in the background.")
+            self._start_background_refresh(kind, fetch)
+
+    async def refresh_for_decision(self) -> None:
+        """Wait for data fetched within the decision lead time, when the network allows it.
+
+        Failures are swallowed: the decision then uses the last good data.
+        """
+        lead = timedelta(minutes=WEATHER_DECISION_LEAD_MINUTES)
+        for kind, fetch_time, fetch in (
+            ("current", self._last_current_fetch_time, self._fetch_current_weather),
+            ("forecast", self._last_forecast_fetch_time, self._fetch_forecast),
+        ):
+            now = dt_util.now()
+            if fetch_time and now - fetch_time < lead:
+                continue
+            retry_after = self._retry_after[kind]
+            if (retry_after and now < retry_after) or not self.budget.remaining:
+                continue
+            # Share the refresh with concurrent callers (e.g. both midnight tasks)
+            if kind not in self._refresh_tasks:
+                self._start_background_refresh(kind, fetch)
+            await asyncio.shield(self._refresh_tasks[kind])
+
+    async def _request(self, kind: str, url: str) -> Any:
+        """GET an OpenWeatherMap endpoint and return its JSON body.
+
+        Sends the stored validators as a conditional request and returns None when
+        the server answers 304 Not Modified.
+        """
+        self.budget.record_call()
+        if not self._has_cached(kind):
+            # Validators without data to revalidate would get a 304 and leave the cache empty
+            self._validators[kind] = {}
+        validators = self._validators[kind]
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=WEATHER_REQUEST_TIMEOUT_SECONDS)) as session:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return None
+                    if response.status != 200:
+                        raise APIConnectionError(f"OpenWeatherMap returned HTTP {response.status}")
+                    data = await response.json()
+                    self._validators[kind] = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }
+                    return data
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+            raise APIConnectionError(f"Error requesting OpenWeatherMap: {ex}") from ex
+
+    def _has_cached(self, kind: str) -> bool:
+        if kind == "current":
+            return self._cache_current is not None
+        return len(self._cache_forecast) > 0
+
+    def export_cache(self) -> dict:
+        """Serializable snapshot of the cached weather, for persistent storage."""
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "current": self._cache_current.as_dict() if self._cache_current else None,
+            "current_fetched_at": self._last_current_fetch_time.isoformat() if self._last_current_fetch_time else None,
+            "forecast": self._cache_forecast.as_list(),
+            "forecast_fetched_at": self._last_forecast_fetch_time.isoformat() if self._last_forecast_fetch_time else None,
+            "validators": self._validators,
+            "budget": {"day": self.budget.day.isoformat(), "calls": self.budget.calls_today},
+        }
+
+    def restore_cache(self, cache: dict) -> bool:
+        """Restore a snapshot made by export_cache, if it was taken for the same location."""
+        if not cache or (cache.get("latitude"), cache.get("longitude")) != (self.latitude, self.longitude):
+            return False
+
+        def parse_time(value):
+            try:
+                return datetime.fromisoformat(value) if value else None
+            except ValueError:
+                return None
+
+        self._cache_current = CurrentWeather.from_dict(cache.get("current"))
+        self._last_current_fetch_time = parse_time(cache.get("current_fetched_at")) if self._cache_current else None
+        self._cache_forecast.clear()
+        self._cache_forecast.ingest(cache.get("forecast") or [])
+        self._cache_forecast.prune(dt_util.start_of_local_day())
+        self._last_forecast_fetch_time = parse_time(cache.get("forecast_fetched_at")) if len(self._cache_forecast) else None
+        # A validator is only valid along with the data it was received with
+        validators = cache.get("validators") or {}
+        for kind in ("current", "forecast"):
+            if self._has_cached(kind) and validators.get(kind):
+                self._validators[kind] = validators[kind]
+
+        budget = cache.get("budget") or {}
+        if budget.get("day") == self.budget.day.isoformat():
+            self.budget.calls_today = max(self.budget.calls_today, budget.get("calls", 0))
+        return True
+
+    def cached_forecast(self) -> ForecastTimeline | None:
+        return self._cache_forecast if len(self._cache_forecast) else None
+
+    def get_cache_status(self) -> dict:
+        """Staleness metadata for the cached weather data."""
+        status = {}
+        for kind, fetch_time in (("current", self._last_current_fetch_time), ("forecast", self._last_forecast_fetch_time)):
+            retry_after = self._retry_after[kind]
+            status[kind] = {
+                "fetched_at": fetch_time.isoformat() if fetch_time else None,
+                "stale": not self._is_fresh(fetch_time),
+                "consecutive_failures": self._consecutive_failures[kind],
+                "retry_after": retry_after.isoformat() if retry_after else None,
+            }
+        return status
+
+    async def _fetch_current_weather(self) -> None:
+        weather_url = f"{OPEN_WEATHER_MAP_CURRENT_URL}appid={self.api_key}&lat={self.latitude}&lon={self.longitude}"
+        _LOGGER.debug("Getting current weather at : %s", weather_url)
+    
+        data = await self._request("current", weather_url)
+        _LOGGER.debug("Current Weather Data: %s", data)
+    
+        if data is None:
+            _LOGGER.debug("Current weather not modified.")
+            self._last_current_fetch_time = dt_util.now()
+            return
+    
+        if not isinstance(data, dict) or "dt" not in data:
+            _LOGGER.error("Error processing Current Weather data: JSON format invalid!")
+            raise APIConnectionError("Error processing Current Weather data: JSON format invalid!")
+    
+        try:
+            self._cache_current = CurrentWeather.from_owm(data, keep_raw=self.keep_raw)
+        except (KeyError, TypeError, ValueError) as ex:
+            _LOGGER.error("Error processing Current Weather data: JSON format invalid!", exc_info=True)
+            raise APIConnectionError("Error processing Current Weather data: JSON format invalid!") from ex
+        self._last_current_fetch_time = dt_util.now()
+
+    async def get_current_weather(self) -> CurrentWeather:
+        await self._get_cached("current", self._cache_current, self._last_current_fetch_time, self._fetch_current_weather)
+        return self._cache_current
+
+
+    async def _fetch_forecast(self) -> None:
+        # No cnt: a single call returns every block for the next 5 days
+        weather_url = f"{OPEN_WEATHER_MAP_FORECAST_URL}&appid={self.api_key}&lat={self.latitude}&lon={self.longitude}"
+        _LOGGER.debug("Getting forecast at: %s", weather_url)
+    
+        data = await self._request("forecast", weather_url)
+        _LOGGER.debug("Forecast Weather Data: %s", data)
+    
+        if data is None:
+            _LOGGER.debug("Forecast not modified.")
+            self._last_forecast_fetch_time = dt_util.now()
+            return
+    
+        try:
+            ingested = self._cache_forecast.ingest(data["list"])
+        except (KeyError, TypeError, ValueError) as ex:
+            _LOGGER.error("Error processing Forecast Weather data: JSON format invalid!", exc_info=True)
+            raise APIConnectionError("Error processing Forecast Weather data: JSON format invalid!") from ex
+    
+        _LOGGER.debug(f"Ingested {ingested} forecast blocks")
+        self._last_forecast_fetch_time = dt_util.now()
+
+    async def get_forecast(self) -> ForecastTimeline:
+        """Obtains the full 5 day / 3 hour forecast, refreshed at most once per cache timeout."""
+        now = dt_util.now()
+    
+        # If it is a new day, drops the blocks that ended before today (no fetch needed)
+        if self.last_forecast_date != now.date():
+            _LOGGER.debug(f"Day changed, pruning forecast blocks from previous days...")
+            self._cache_forecast.prune(dt_util.start_of_local_day())
+            self.last_forecast_date = now.date()
+    
+        await self._get_cached("forecast", len(self._cache_forecast), self._last_forecast_fetch_time, self._fetch_forecast)
+        return self._cache_forecast
+
+
+class HomeAssistantWeatherProvider(WeatherProvider):
+    """Weather provider reading a HA weather entity (Met.no, local station, ...)."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str, timeout: int) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.timeout = timeout
+        self._cache_forecast = ForecastTimeline()
+        self._last_forecast_fetch_time = None
+
+    def get_refresh_interval(self) -> timedelta:
+        return timedelta(minutes=self.timeout)
+
+    def cached_forecast(self) -> ForecastTimeline | None:
+        return self._cache_forecast if len(self._cache_forecast) else None
+
+    def get_cache_status(self) -> dict:
+        fetch_time = self._last_forecast_fetch_time
+        state = self.hass.states.get(self.entity_id)
+        return {
+            "current": {
+                # The entity state is read live: it is as fresh as the entity's last update
+                "fetched_at": state.last_updated.isoformat() if state else None,
+                "stale": state is None,
+                "consecutive_failures": 0,
+                "retry_after": None,
+            },
+            "forecast": {
+                "fetched_at": fetch_time.isoformat() if fetch_time else None,
+                "stale": fetch_time is None or dt_util.now() - fetch_time >= self.get_refresh_interval(),
+                "consecutive_failures": 0,
+                "retry_after": None,
+            },
+        }
+
+    async def _fetch_forecast(self) -> None:
+        for forecast_type, block_seconds in FORECAST_TYPES:
+            try:
+                response = await self.hass.services.async_call(
+                    "weather",
+                    "get_forecasts",
+                    {"entity_id": self.entity_id, "type": forecast_type},
+                    blocking=True,
+                    return_response=True,
+                )
+            except HomeAssistantError as ex:
+                _LOGGER.debug(f"{self.entity_id} does not provide {forecast_type} forecasts: {ex}")
+                continue
+
+            items = (response or {}).get(self.entity_id, {}).get("forecast") or []
+            blocks = []
+            for item in items:
+                start = dt_util.parse_datetime(str(item.get("datetime")))
+                if start is None:
+                    continue
+                blocks.append((
+                    int(start.timestamp()),
+                    float(item.get("precipitation_probability") or 0.0) / 100,
+                    float(item.get("precipitation") or 0.0),
+                ))
+            if not blocks:
+                continue
+
+            timeline = ForecastTimeline(block_seconds=block_seconds)
+            timeline.ingest_blocks(blocks)
+            self._cache_forecast = timeline
+            self._last_forecast_fetch_time = dt_util.now()
+            return
+
+        raise APIConnectionError(f"No forecast available from {self.entity_id}")
+
+    async def get_forecast(self) -> ForecastTimeline:
+        fetch_time = self._last_forecast_fetch_time
+        if fetch_time and dt_util.now() - fetch_time < self.get_refresh_interval():
+            return self._cache_forecast
+        try:
+            await self._fetch_forecast()
+        except APIConnectionError:
+            if not len(self._cache_forecast):
+                raise
+            _LOGGER.warning(f"Failed refreshing forecast from {self.entity_id}, returning stale data.")
+        return self._cache_forecast
+
+    async def get_current_weather(self) -> CurrentWeather:
+        state = self.hass.states.get(self.entity_id)
+        if state is None or state.state in ("unknown", "unavailable"):
+            raise APIConnectionError(f"Weather entity {self.entity_id} is unavailable")
+
+        now = dt_util.now()
+        current = CurrentWeather(
+            dt=int(now.timestamp()),
+            condition=state.state,
+            temperature=state.attributes.get("temperature"),
+            humidity=state.attributes.get("humidity"),
+        )
+        if state.state in RAINY_CONDITIONS:
+            # The entity state has no rain rate; use the forecast for the coming hour
+            current.rain_1h = 0.0
+            try:
+                forecast = await self.get_forecast()
+                current.rain_1h = forecast.rain_between(now, now + timedelta(hours=1))
+            except APIConnectionError:
+                pass
+        return current
+
+    async def refresh_for_decision(self) -> None:
+        # Reading HA is free, so decisions always use a newly read forecast
+        self._last_forecast_fetch_time = None
+        try:
+            await self.get_forecast()
+        except APIConnectionError as ex:
+            _LOGGER.warning(f"Failed refreshing forecast from {self.entity_id}: {ex}")
+
+
+class HedgedWeatherProvider(WeatherProvider):
+    """Weather provider querying several providers with hedged requests.
+
+    A request goes to the first provider; if it has not answered after the hedge
+    delay (or failed) the next provider is queried as well, and the first valid
+    answer wins. Slower requests finish in the background so their caches stay warm.
+    """
+
+    def __init__(self, hass: HomeAssistant, providers: list[WeatherProvider], hedge_delay: float) -> None:
+        """Initialise."""
+        self.hass = hass
+        self.providers = providers
+        self.hedge_delay = hedge_delay
+        # Budget of the first provider with a request quota, for the API calls sensor
+        self.budget = next((provider.budget for provider in providers if provider.budget), None)
+        self._latency: list[float | None] = [None] * len(providers)
+        self._wins = [0] * len(providers)
+        self._failures = [0] * len(providers)
+        # Requests still running, losers of a hedge included
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _timed(self, index: int, method: str, call: Callable[[WeatherProvider], Awaitable]) -> Any:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            result = await call(self.providers[index])
+        except Exception:
+            self._failures[index] += 1
+            raise
+        latency = loop.time() - start
+        previous = self._latency[index]
+        # Exponentially weighted moving average
+        self._latency[index] = latency if previous is None else 0.8 * previous + 0.2 * latency
+        return result
+
+    async def _hedged(self, method: str, call: Callable[[WeatherProvider], Awaitable] | None = None) -> Any:
+        call = call or methodcaller(method)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + WEATHER_REQUEST_TIMEOUT_SECONDS
+        pending: dict[asyncio.Task, int] = {}
+        next_index = 0
+
+        def launch() -> None:
+            nonlocal next_index
+            task = self.hass.async_create_background_task(
+                self._timed(next_index, method, call), f"Weather {method} from provider {next_index}"
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            pending[task] = next_index
+            next_index += 1
+
+        launch()
+        while pending:
+            can_hedge = next_index < len(self.providers)
+            timeout = deadline - loop.time()
+            if can_hedge:
+                timeout = min(timeout, self.hedge_delay)
+            if timeout <= 0:
+                break
+
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if not can_hedge:
+                    break
+                _LOGGER.debug(f"Weather {method} slower than {self.hedge_delay}s, hedging to provider {next_index}.")
+                launch()
+                continue
+
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    result = task.result()
+                except Exception as ex:
+                    _LOGGER.debug(f"Weather provider {index} failed {method}: {ex}")
+                    continue
+                self._wins[index] += 1
+                for other in pending:
+                    other.add_done_callback(_consume_result)
+                return result
+
+            # Everything that finished failed: query the next provider right away
+            if next_index < len(self.providers):
+                launch()
+
+        for other in pending:
+            other.add_done_callback(_consume_result)
+        raise APIConnectionError(f"No weather provider answered {method}")
+
+    async def get_current_weather(self) -> CurrentWeather:
+        return await self._hedged("get_current_weather")
+
+    async def get_forecast(self) -> ForecastTimeline:
+        return await self._hedged("get_forecast")
+
+    def set_decision_times(self, decision_times: list[datetime], active: bool = False) -> None:
+        for provider in self.providers:
+            provider.set_decision_times(decision_times, active)
+
+    async def refresh_for_decision(self) -> None:
+        # Only the primary is refreshed, unless it is slow or still without fresh data
+        try:
+            await self._hedged("refresh_for_decision", _refresh_for_decision)
+        except APIConnectionError as ex:
+            _LOGGER.warning(f"Failed refreshing weather before a decision: {ex}")
+
+    def get_refresh_interval(self) -> timedelta:
+        return self.providers[0].get_refresh_interval()
+
+    def cached_forecast(self) -> ForecastTimeline | None:
+        return next(
+            (forecast for forecast in (provider.cached_forecast() for provider in self.providers) if forecast), None
+        )
+
+    def get_cache_status(self) -> dict:
+        status = dict(self.providers[0].get_cache_status())
+        status["providers"] = [
+            {
+                "provider": type(provider).__name__,
+                "latency_ms": round(latency * 1000) if latency is not None else None,
+                "wins": wins,
+                "failures": failures,
+            }
+            for provider, latency, wins, failures in zip(self.providers, self._latency, self._wins, self._failures)
+        ]
+        return status
+
+    def export_cache(self) -> dict:
+        return {"providers": [provider.export_cache() for provider in self.providers]}
+
+    def restore_cache(self, cache: dict) -> bool:
+        caches = (cache or {}).get("providers")
+        if not isinstance(caches, list) or len(caches) != len(self.providers):
+            return False
+        return any([provider.restore_cache(provider_cache) for provider, provider_cache in zip(self.providers, caches)])
+
+    def async_cancel(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for provider in self.providers:
+            provider.async_cancel()
+
+
+async def _refresh_for_decision(provider: WeatherProvider) -> None:
+    """Refresh a provider, failing when its forecast is still stale (budget, backoff, ...)."""
+    await provider.refresh_for_decision()
+    if provider.get_cache_status().get("forecast", {}).get("stale"):
+        raise APIConnectionError("Forecast still stale after refresh")
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Retrieve the outcome of a request nobody waits for anymore."""
+    if not task.cancelled():
+        task.exception()
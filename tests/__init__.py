@@ -0,0 +1 @@
+"""Tests for the Solem Bluetooth Watering Controller integration."""
@@ -0,0 +1,65 @@
+"""Tests for the incremental watering amounts."""
+
+from custom_components.solem_bluetooth_watering_controller.amounts import WateringAmounts
+
+
+def make_amounts() -> WateringAmounts:
+    amounts = WateringAmounts(3)
+    amounts.set_inputs(minutes=[10, 10, 10], flow_rates=[12, 12, 12], areas=[10, 20, 30])
+    amounts.recompute()
+    return amounts
+
+
+def test_first_recompute_reports_every_station():
+    amounts = WateringAmounts(2)
+    amounts.set_inputs(minutes=[10, 5], flow_rates=[12, 6], areas=[10, 10])
+    assert amounts.recompute() == {0, 1}
+    assert amounts.targets == [12.0, 3.0]
+    assert amounts.remaining == [12.0, 3.0]
+    assert amounts.needs_watering
+
+
+def test_recompute_returns_only_changed_stations():
+    amounts = make_amounts()
+    amounts.set_inputs(areas=[10, 40, 30])
+    assert amounts.recompute() == {1}
+    assert amounts.targets == [12.0, 3.0, 4.0]
+
+
+def test_unchanged_inputs_recompute_nothing():
+    amounts = make_amounts()
+    amounts.set_inputs(minutes=[10, 10, 10], flow_rates=[12, 12, 12], areas=[10, 20, 30])
+    assert amounts.recompute() == set()
+
+
+def test_rain_affects_every_station():
+    amounts = make_amounts()
+    amounts.set_inputs(rain_mm=2)
+    assert amounts.recompute() == {0, 1, 2}
+    assert amounts.forecasted == [10.0, 4.0, 2.0]
+
+    amounts.set_inputs(rain_mm=5)
+    assert amounts.recompute() == {0, 1, 2}
+    assert amounts.forecasted == [7.0, 1.0, 0.0]
+
+
+def test_rain_covering_targets_already_met_reports_no_change():
+    amounts = make_amounts()
+    amounts.set_inputs(rain_mm=20)
+    amounts.recompute()
+    amounts.set_inputs(rain_mm=25)
+    assert amounts.recompute() == set()
+    assert not amounts.needs_watering
+
+
+def test_applied_water_only_moves_remaining():
+    amounts = make_amounts()
+    amounts.set_inputs(applied=[12, 0, 0])
+    assert amounts.recompute() == {0}
+    assert amounts.forecasted == [12.0, 6.0, 4.0]
+    assert amounts.remaining == [0.0, 6.0, 4.0]
+    assert amounts.needs_watering
+
+    amounts.set_inputs(applied=[12, 6, 4])
+    assert amounts.recompute() == {1, 2}
+    assert not amounts.needs_watering
@@ -0,0 +1,95 @@
+"""Tests for the forecast timeline range queries."""
+
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+
+from custom_components.solem_bluetooth_watering_controller.forecast import (
+    FORECAST_BLOCK_SECONDS,
+    ForecastTimeline,
+)
+
+START = datetime(2026, 7, 1, tzinfo=timezone.utc)
+
+
+def make_items(count: int, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "dt": int(START.timestamp()) + i * FORECAST_BLOCK_SECONDS,
+            "pop": round(rng.random(), 2),
+            "rain": {"3h": round(rng.uniform(0, 4), 2) if rng.random() < 0.6 else 0.0},
+        }
+        for i in range(count)
+    ]
+
+
+def naive_rain(items: list[dict], start: datetime, end: datetime) -> float:
+    """Rain in [start, end), prorating every block by the part of it inside the window."""
+    total = 0.0
+    for item in items:
+        block_start = item["dt"]
+        block_end = block_start + FORECAST_BLOCK_SECONDS
+        overlap = min(block_end, end.timestamp()) - max(block_start, start.timestamp())
+        if overlap > 0:
+            total += item["rain"]["3h"] * overlap / FORECAST_BLOCK_SECONDS
+    return total
+
+
+def naive_max_pop(items: list[dict], start: datetime, end: datetime) -> float:
+    pops = [
+        item["pop"]
+        for item in items
+        if min(item["dt"] + FORECAST_BLOCK_SECONDS, end.timestamp()) > max(item["dt"], start.timestamp())
+    ]
+    return max(pops, default=0.0)
+
+
+def windows():
+    """Windows of every length from empty to past the forecast, on and off block boundaries."""
+    rng = random.Random(2)
+    for _ in range(300):
+        start = START + timedelta(hours=rng.randint(-6, 130), minutes=rng.choice((0, 0, 15, 30)))
+        yield start, start + timedelta(hours=rng.randint(0, 48), minutes=rng.choice((0, 0, 45)))
+
+
+def test_range_queries_match_naive_scan():
+    items = make_items(40)
+    timeline = ForecastTimeline(items)
+    for start, end in windows():
+        assert timeline.rain_between(start, end) == pytest.approx(naive_rain(items, start, end), abs=1e-9)
+        assert timeline.max_pop_between(start, end) == naive_max_pop(items, start, end)
+
+
+@pytest.mark.parametrize("hour", [0, 1, 2, 3, 7, 50])
+def test_single_hour_range(hour):
+    items = make_items(40)
+    timeline = ForecastTimeline(items)
+    start = START + timedelta(hours=hour)
+    end = start + timedelta(hours=1)
+    block = items[hour // 3]
+    assert timeline.rain_between(start, end) == pytest.approx(block["rain"]["3h"] / 3)
+    assert timeline.max_pop_between(start, end) == block["pop"]
+
+
+def test_empty_range():
+    timeline = ForecastTimeline(make_items(40))
+    moment = START + timedelta(hours=10)
+    assert timeline.rain_between(moment, moment) == 0.0
+    assert timeline.max_pop_between(moment, moment) == 0.0
+    assert timeline.rain_between(moment, moment - timedelta(hours=3)) == 0.0
+
+
+def test_range_outside_forecast():
+    timeline = ForecastTimeline(make_items(8))
+    later = START + timedelta(days=2)
+    assert timeline.rain_between(later, later + timedelta(days=1)) == 0.0
+    assert timeline.max_pop_between(later, later + timedelta(days=1)) == 0.0
+
+
+def test_empty_timeline():
+    timeline = ForecastTimeline()
+    assert len(timeline) == 0
+    assert timeline.rain_between(START, START + timedelta(days=1)) == 0.0
+    assert timeline.max_pop_between(START, START + timedelta(days=1)) == 0.0
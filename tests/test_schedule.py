@@ -0,0 +1,103 @@
+"""Tests for the compiled irrigation schedule."""
+
+from datetime import time
+
+import pytest
+
+from custom_components.solem_bluetooth_watering_controller.schedule import (
+    DEFAULT_INTERVAL_DAYS,
+    CompiledSchedule,
+    MonthSchedule,
+    ScheduleError,
+    parse_hour,
+)
+
+
+def make_schedule(**months) -> list[dict]:
+    """12 months without watering, the given ones (e.g. jul=...) replaced."""
+    names = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+    empty = {"interval_days": 2, "hours": [], "stations": {"station_1_minutes": 0, "station_2_minutes": 0}}
+    return [months.get(name, empty) for name in names]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("07:00", time(7, 0)), ("7:05", time(7, 5)), ("23:59:30", time(23, 59)), (time(6, 30, 15), time(6, 30))],
+)
+def test_parse_hour(value, expected):
+    assert parse_hour(value) == expected
+
+
+@pytest.mark.parametrize("value", ["24:00", "07:60", "7h", "", "07:00 PM", None, 700])
+def test_parse_hour_rejects_invalid_hours(value):
+    with pytest.raises(ScheduleError):
+        parse_hour(value)
+
+
+def test_month_hours_are_sorted_without_duplicates():
+    month = MonthSchedule.compile(
+        {"interval_days": 3, "hours": ["21:00", "07:00", "07:00:00", ""], "stations": {"station_2_minutes": 15}},
+        num_stations=3,
+    )
+    assert month.interval_days == 3
+    assert month.hours == (time(7, 0), time(21, 0))
+    assert month.station_minutes == (0, 15, 0)
+    assert month.waters
+
+
+@pytest.mark.parametrize("hours", [[], None, [""]])
+def test_month_without_hours_does_not_water(hours):
+    month = MonthSchedule.compile({"interval_days": 2, "hours": hours, "stations": {"station_1_minutes": 10}}, 2)
+    assert month.hours == ()
+    assert not month.waters
+
+
+def test_month_defaults_and_extra_stations():
+    month = MonthSchedule.compile({"stations": {"station_1_minutes": "5", "station_9_minutes": 30}}, 2)
+    assert month.interval_days == DEFAULT_INTERVAL_DAYS
+    assert month.station_minutes == (5, 0)
+
+
+@pytest.mark.parametrize(
+    "month_config",
+    [
+        "07:00",
+        {"hours": ["25:00"]},
+        {"interval_days": -1},
+        {"interval_days": True},
+        {"stations": {"station_one_minutes": 5}},
+        {"stations": {"station_1_minutes": -5}},
+        {"stations": {"station_1_minutes": "ten"}},
+    ],
+)
+def test_month_rejects_invalid_configuration(month_config):
+    with pytest.raises(ScheduleError):
+        MonthSchedule.compile(month_config, 2)
+
+
+def test_compile_schedule():
+    july = {"interval_days": 1, "hours": ["06:00", "20:00"], "stations": {"station_1_minutes": 10}}
+    schedule = CompiledSchedule.compile(make_schedule(jul=july), 2)
+    assert len(schedule.months) == 12
+    assert schedule.month(7).hours == (time(6, 0), time(20, 0))
+    assert schedule.month(7).station_minutes == (10, 0)
+    assert not schedule.month(6).waters
+    assert schedule.next_watering_month(1) is schedule.month(7)
+    assert schedule.next_watering_month(8) is schedule.month(7)
+
+
+def test_compile_schedule_without_watering_months():
+    schedule = CompiledSchedule.compile(make_schedule(), 2)
+    assert not any(month.waters for month in schedule.months)
+    assert schedule.next_watering_month(1) is None
+
+
+def test_compile_schedule_reports_the_invalid_month():
+    with pytest.raises(ScheduleError, match="Month 3"):
+        CompiledSchedule.compile(make_schedule(mar={"hours": ["7h"]}), 2)
+
+
+@pytest.mark.parametrize("schedule", [None, {}, make_schedule()[:11]])
+def test_compile_schedule_needs_twelve_months(schedule):
+    with pytest.raises(ScheduleError):
+        CompiledSchedule.compile(schedule, 2)
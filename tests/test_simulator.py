@@ -0,0 +1,55 @@
+"""Tests for the season simulator and the schedule optimizer."""
+
+import numpy as np
+
+from custom_components.solem_bluetooth_watering_controller.simulator import (
+    optimize_schedule,
+    simulate,
+    watering_days,
+)
+
+
+def test_watering_days_follow_interval_and_rain():
+    rain = np.array([0.0, 0.0, 3.0, 0.0, 0.0, 0.0])
+    mask = watering_days(rain, [2])
+    # Day 0 waters, day 2 waters and rains, day 4 is 2 days after both
+    assert mask.tolist() == [[True, False, True, False, True, False]]
+
+
+def test_simulate_prorates_partial_last_week():
+    rain = np.zeros(8)
+    mask = np.zeros(8, dtype=bool)
+    result = simulate(rain, mask, np.array([1]), np.array([0]), np.array([1.0]), np.array([7.0]))
+    # A whole week short of 7 mm, then one day short of 1 mm
+    assert result.deficit_mm.tolist() == [[[8.0]]]
+
+
+def test_simulate_counts_rain_towards_the_need():
+    rain = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.0])
+    mask = np.array([True, False, False, False, False, False, False])
+    result = simulate(rain, mask, np.array([1]), np.array([2]), np.array([1.0]), np.array([7.0]))
+    assert result.sessions.tolist() == [[[1]]]
+    assert result.water_mm.tolist() == [[[2.0]]]
+    assert result.deficit_mm.tolist() == [[[0.0]]]
+
+
+def test_optimize_schedule_prefers_fewest_sessions():
+    proposal = optimize_schedule(
+        np.zeros(14), [1.0], [7.0], intervals=(1, 7), occurrences=(1,), minutes=(0, 5, 10)
+    )
+    # Daily 5 minutes meets the need in 14 sessions, weekly 10 minutes in 2
+    assert proposal.interval_days == 7
+    assert proposal.occurrences == 1
+    assert proposal.station_minutes == (10,)
+    assert proposal.sessions == 2
+    assert proposal.watering_days == 2
+    assert proposal.deficit_mm == 0.0
+
+
+def test_optimize_schedule_skips_stations_without_flow():
+    proposal = optimize_schedule(
+        np.zeros(14), [1.0, 0.0], [7.0, 7.0], intervals=(1, 7), occurrences=(1,), minutes=(0, 5, 10)
+    )
+    assert proposal.station_minutes == (10, 0)
+    assert proposal.sessions == 2
+    assert np.isfinite(proposal.deficit_mm)
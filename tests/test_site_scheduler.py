@@ -0,0 +1,137 @@
+"""Tests for the site wide admission control of valve openings."""
+
+import asyncio
+
+from custom_components.solem_bluetooth_watering_controller.const import SITE_LEASE_MAX_BYPASS
+from custom_components.solem_bluetooth_watering_controller.site_scheduler import SiteFlowScheduler
+
+
+def run(scenario):
+    """Run a test scenario in an event loop (leases hold futures)."""
+    asyncio.run(scenario())
+
+
+def test_flow_limit():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 20, 0)
+        first = site.request("entry", "a", 12, 10)
+        second = site.request("entry", "b", 12, 10)
+        assert first.granted
+        assert not second.granted
+
+        first.release()
+        assert second.granted
+        assert site.status()["flow"] == 12
+
+    run(scenario)
+
+
+def test_valve_limit():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 0, 2)
+        leases = [site.request("entry", name, 1, 10) for name in "abc"]
+        assert [lease.granted for lease in leases] == [True, True, False]
+
+    run(scenario)
+
+
+def test_most_restrictive_limits_apply():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("one", 30, 3)
+        site.register("two", 20, 0)
+        assert site.max_flow == 20
+        assert site.max_valves == 3
+
+        site.unregister("two")
+        assert site.max_flow == 30
+
+    run(scenario)
+
+
+def test_lone_oversized_run_still_runs():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 10, 0)
+        oversized = site.request("entry", "a", 25, 10)
+        other = site.request("entry", "b", 5, 10)
+        assert oversized.granted
+        assert not other.granted
+
+    run(scenario)
+
+
+def test_release_of_waiting_lease_cancels_it():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 0, 1)
+        active = site.request("entry", "a", 1, 10)
+        waiting = site.request("entry", "b", 1, 10)
+
+        waiting.release()
+        assert waiting.future.cancelled()
+        assert not waiting.granted
+        assert site.status()["waiting"] == []
+
+        active.release()
+        assert site.status()["active"] == []
+
+    run(scenario)
+
+
+def test_unregister_cancels_waiting_leases_of_the_entry():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("one", 0, 1)
+        site.register("two", 0, 1)
+        active = site.request("one", "a", 1, 10)
+        unloaded = site.request("two", "b", 1, 10)
+        kept = site.request("one", "c", 1, 10)
+
+        site.unregister("two")
+        assert unloaded.future.cancelled()
+        assert not kept.granted
+
+        active.release()
+        assert kept.granted
+
+    run(scenario)
+
+
+def test_longest_waiting_run_is_admitted_first():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 0, 1)
+        active = site.request("entry", "a", 1, 10)
+        short = site.request("entry", "short", 1, 5)
+        long = site.request("entry", "long", 1, 30)
+
+        active.release()
+        assert long.granted
+        assert not short.granted
+
+    run(scenario)
+
+
+def test_overtaken_run_goes_first():
+    async def scenario():
+        site = SiteFlowScheduler()
+        site.register("entry", 0, 1)
+        active = site.request("entry", "a", 1, 10)
+        short = site.request("entry", "short", 1, 5)
+
+        # A stream of longer runs overtakes the short one until it ages
+        for _ in range(SITE_LEASE_MAX_BYPASS):
+            longer = site.request("entry", "long", 1, 30)
+            active.release()
+            assert longer.granted
+            assert not short.granted
+            active = longer
+
+        site.request("entry", "long", 1, 30)
+        active.release()
+        assert short.granted
+
+    run(scenario)
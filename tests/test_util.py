@@ -0,0 +1,93 @@
+"""Tests for the time based helpers."""
+
+import pytest
+
+from custom_components.solem_bluetooth_watering_controller import util
+from custom_components.solem_bluetooth_watering_controller.util import ElapsedTimer, RateIntegrator
+
+
+class FakeClock:
+    """Monotonic and wall clock, advanced by hand; the wall clock starts at 1000000."""
+
+    def __init__(self) -> None:
+        self.monotonic = 50.0
+        self.offset = 1_000_000.0 - self.monotonic
+
+    def time(self) -> float:
+        return self.monotonic + self.offset
+
+    def advance(self, seconds: float) -> None:
+        self.monotonic += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(util.time, "monotonic", lambda: fake.monotonic)
+    monkeypatch.setattr(util.time, "time", fake.time)
+    return fake
+
+
+def test_rate_integrator_accrues_at_the_current_rate(clock):
+    integrator = RateIntegrator()
+    assert integrator.observe(2.0) == 0.0
+    clock.advance(1800)
+    assert integrator.advance() == pytest.approx(1.0)
+    clock.advance(900)
+    # The half hour at 2 mm/h is accounted before switching to the new rate
+    assert integrator.observe(4.0) == pytest.approx(0.5)
+    clock.advance(900)
+    assert integrator.advance() == pytest.approx(1.0)
+
+
+def test_rate_integrator_zero_rate_accrues_nothing(clock):
+    integrator = RateIntegrator()
+    integrator.observe(0.0)
+    clock.advance(3600)
+    assert integrator.advance() == 0.0
+
+
+def test_rate_integrator_same_observation_does_not_restart(clock):
+    integrator = RateIntegrator(max_age=3600)
+    observed_at = clock.time()
+    integrator.observe(6.0, observed_at)
+    clock.advance(1800)
+    # Served again from a cache: neither reset nor extended
+    assert integrator.observe(6.0, observed_at) == pytest.approx(3.0)
+    clock.advance(3600)
+    assert integrator.advance() == pytest.approx(3.0)
+    clock.advance(600)
+    assert integrator.advance() == 0.0
+
+
+def test_rate_integrator_old_observation_expires(clock):
+    integrator = RateIntegrator(max_age=3600)
+    # Observed 45 minutes ago: only 15 more minutes count
+    integrator.observe(4.0, clock.time() - 2700)
+    clock.advance(1800)
+    assert integrator.advance() == pytest.approx(1.0)
+
+
+def test_rate_integrator_new_observation_replaces_expiry(clock):
+    integrator = RateIntegrator(max_age=600)
+    integrator.observe(6.0, clock.time())
+    clock.advance(1200)
+    assert integrator.observe(3.0, clock.time()) == pytest.approx(1.0)
+    clock.advance(300)
+    assert integrator.advance() == pytest.approx(0.25)
+
+
+def test_elapsed_timer_accumulates_between_calls(clock):
+    timer = ElapsedTimer()
+    clock.advance(10)
+    assert timer.elapsed() == pytest.approx(10)
+    clock.advance(2.5)
+    clock.advance(2.5)
+    assert timer.elapsed() == pytest.approx(5)
+    assert timer.elapsed() == 0.0
+
+    total = 0.0
+    for _ in range(4):
+        clock.advance(15)
+        total += timer.elapsed()
+    assert total == pytest.approx(60)